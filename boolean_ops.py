@@ -0,0 +1,62 @@
+from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse, BRepAlgoAPI_Cut
+from OCC.Core.TopTools import TopTools_ListOfShape
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.BRep import BRep_Builder
+
+
+def _shape_list(shapes):
+    shape_list = TopTools_ListOfShape()
+    for shape in shapes:
+        shape_list.Append(shape)
+    return shape_list
+
+
+def _run(bop, arguments, tools, destructive):
+    """
+    Runs one N-ary boolean: all arguments / tools go through a single
+    intersection pass, with OCC's parallel mode enabled.
+
+    destructive=True lets OCC modify the inputs instead of copying them:
+    only for freshly built shapes nothing else shares (never cached
+    templates or their located copies).
+    """
+    bop.SetArguments(_shape_list(arguments))
+    bop.SetTools(_shape_list(tools))
+    bop.SetRunParallel(True)
+    bop.SetNonDestructive(not destructive)
+    bop.Build()
+
+    if not bop.IsDone():
+        raise RuntimeError("Boolean operation failed")
+
+    return bop.Shape()
+
+
+def fuse_shapes(first, *others, destructive=False):
+    """Fuse of first with all other shapes in one operation"""
+    return _run(BRepAlgoAPI_Fuse(), [first], others, destructive)
+
+
+def cut_shapes(body, *tools, destructive=False):
+    """body minus all tool shapes in one operation"""
+    return _run(BRepAlgoAPI_Cut(), [body], tools, destructive)
+
+
+def compound_shapes(*shapes):
+    """
+    Groups shapes into one TopoDS_Compound without any boolean:
+    enough for display / placement of parts that only touch.
+    """
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def join_shapes(*shapes, fuse=False, destructive=False):
+    """fuse_shapes() when a single solid is required, else compound_shapes()"""
+    if fuse:
+        return fuse_shapes(*shapes, destructive=destructive)
+    return compound_shapes(*shapes)
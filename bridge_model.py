@@ -3,20 +3,31 @@
 # Parametric 3D CAD Model of Steel Girder Bridge
 
 
-from OCC.Display.backend import load_backend
-load_backend("pyside6")
+import argparse
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from types import MappingProxyType
+
+import numpy as np
 
-from OCC.Display.SimpleGui import init_display
 from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 from OCC.Core.Quantity import Quantity_Color, Quantity_TOC_RGB
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
+from OCC.Core.BRep import BRep_Builder
+from OCC.Core.TopoDS import TopoDS_Compound
+from OCC.Core.BRepMesh import BRepMesh_IncrementalMesh
+from OCC.Core.Bnd import Bnd_Box
+from OCC.Core.BRepBndLib import brepbndlib
+from OCC.Core.AIS import AIS_Shape, AIS_MultipleConnectedInteractive
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 from deck import create_deck_slab
-from deck_texture import place_deck_texture
+from deck_texture import place_deck_texture, TRI_SIZE_MAX
 from draw_i_section import create_i_section
 from validation import validate_bridge_inputs
+from layout import girder_offsets, bracing_layout, deck_width, barrier_offsets
 from railing import create_railing, place_railing
 from cross_bracing import (
     create_x_bracing_between_girders,
@@ -72,8 +83,10 @@ cross_bracing_section_props = get_section_props(
     cross_bracing_section_name
 )
 if cross_bracing_section_type == "DOUBLE_ANGLE":
-    cross_bracing_section_props = dict(cross_bracing_section_props)
-    cross_bracing_section_props["connection_type"] = cross_bracing_connection
+    cross_bracing_section_props = MappingProxyType({
+        **cross_bracing_section_props,
+        "connection_type": cross_bracing_connection
+    })
 
 
 
@@ -99,12 +112,30 @@ median_offset_z = deck_thickness  # sits on deck
 
 enable_median = False
 
+# MESHING PARAMETERS
+mesh_deflection = 10.0         # linear deflection (mm) for pre-meshing
+
+# DECK TEXTURE PARAMETERS
+texture_density = 1.0          # 1.0 = full detail, lower for large decks
+texture_mesh_deflection = 5.0  # coarse: texture elements are tiny
+texture_tile_length = 5000     # texture is displayed in tiles along X
+texture_min_pixels = 1         # LOD: skip texture below this on-screen size
+
+# VIEWER
+# False: OCC viewer (pyside6) | True: VTK viewer (needs the vtk package)
+use_vtk = False
+
+# BUILD PARAMETERS
+# Threads used by assemble_bridge. 1 = serial (default): a speedup
+# depends on pythonocc releasing the GIL, which is not measured here.
+build_workers = 1
+
 
 
 # COLORS
 COLOR_GIRDER        = (72/255, 72/255, 54/255)
 COLOR_DECK          = (0.7, 0.7, 0.7)
-texture_color =  Quantity_Color(0.30, 0.30, 0.30, Quantity_TOC_RGB)
+COLOR_TEXTURE       = (0.30, 0.30, 0.30)
 COLOR_CROSS_BRACING =  (95/255, 85/255, 110/255)      #(134/255, 134/255, 100/255)
 COLOR_CRASH_BARRIER = (83/255, 83/255, 83/255)
 COLOR_RAILING       = (0.2, 0.2, 0.2)
@@ -113,71 +144,92 @@ COLOR_STIFFENER = (30/255, 30/255, 30/255)
 
 
 
+# One shared template shape + (N, 3) array of the X/Y/Z offset of
+# every placed copy (structure of arrays instead of N placed shapes)
+Placements = namedtuple("Placements", "base_shape offsets")
+
+
+def materialize(placements):
+    """
+    Returns the placed copies of a Placements template as shapes.
+    Rigid moves only: each copy shares the template BRep (and its
+    triangulation) and just carries its own location.
+    """
+    # One transform reused for every copy (OCC copies it on use)
+    trsf = gp_Trsf()
+    offset = gp_Vec(0, 0, 0)
+    shapes = []
+
+    for x, y, z in placements.offsets.tolist():
+        offset.SetCoord(x, y, z)
+        trsf.SetTranslation(offset)
+        shapes.append(placements.base_shape.Moved(TopLoc_Location(trsf)))
+
+    return shapes
+
+
 def build_girders():
     """
     Builds girders symmetrically across the centerline
     and adds stiffeners at BOTH ends of the span.
-    """
-    girders = []
-    stiffeners = []
-    total_width = (num_girders - 1) * girder_spacing
 
-    for i in range(num_girders):
-
-        #  Create I-girder
-        girder = create_i_section(
-            span_length_L,
-            girder_section_bf,
-            girder_section_d,
-            girder_section_tf,
-            girder_section_tw
-        )
+    All girders share one I-section and one set of stiffeners, so
+    nothing is placed here: both are returned as Placements
+    (template + per-girder offsets) and materialized on demand.
+    """
 
-        #  STIFFENERS AT START (x = 0)
-        start_left, start_right = create_girder_stiffeners(
-            girder_depth=girder_section_d,
-            girder_flange_width=girder_section_bf,
-            girder_web_thickness=girder_section_tw,
-            girder_flange_thickness=girder_section_tf,
-            stiffener_width=stiffener_width,
-            stiffener_length=stiffener_length,
-            x_offset=0.0
-        )
+    #  Create I-girder (shared by all girders)
+    girder_base = create_i_section(
+        span_length_L,
+        girder_section_bf,
+        girder_section_d,
+        girder_section_tf,
+        girder_section_tw
+    )
 
-        #  STIFFENERS AT END (x = L - stiffener_length) 
-        end_left, end_right = create_girder_stiffeners(
-            girder_depth=girder_section_d,
-            girder_flange_width=girder_section_bf,
-            girder_web_thickness=girder_section_tw,
-            girder_flange_thickness=girder_section_tf,
-            stiffener_width=stiffener_width,
-            stiffener_length=stiffener_length,
-            x_offset=span_length_L - stiffener_length
-        )
+    #  STIFFENERS AT START (x = 0)
+    start_left, start_right = create_girder_stiffeners(
+        girder_depth=girder_section_d,
+        girder_flange_width=girder_section_bf,
+        girder_web_thickness=girder_section_tw,
+        girder_flange_thickness=girder_section_tf,
+        stiffener_width=stiffener_width,
+        stiffener_length=stiffener_length,
+        x_offset=0.0
+    )
 
-        # Collect all 4
-        local_stiffeners = [
-            start_left, start_right,
-            end_left, end_right
-        ]
+    #  STIFFENERS AT END (x = L - stiffener_length) 
+    end_left, end_right = create_girder_stiffeners(
+        girder_depth=girder_section_d,
+        girder_flange_width=girder_section_bf,
+        girder_web_thickness=girder_section_tw,
+        girder_flange_thickness=girder_section_tf,
+        stiffener_width=stiffener_width,
+        stiffener_length=stiffener_length,
+        x_offset=span_length_L - stiffener_length
+    )
 
-        # 3. Move girder to correct Y position
-        y_offset = (i * girder_spacing) - (total_width / 2)
+    # Collect all 4 into one set, so each girder moves them in ONE transform
+    stiffener_set = make_compound([
+        start_left, start_right,
+        end_left, end_right
+    ])
 
-        trsf = gp_Trsf()
-        trsf.SetTranslation(gp_Vec(0, y_offset, 0))
+    # Girder offsets (girders only move along Y)
+    offsets = np.zeros((num_girders, 3))
+    offsets[:, 1] = girder_offsets(num_girders, girder_spacing)
 
-        moved_girder = BRepBuilderAPI_Transform(girder, trsf).Shape()
-        girders.append(moved_girder)
+    return Placements(girder_base, offsets), Placements(stiffener_set, offsets)
 
-        # Move ALL stiffeners with girder
-        for stiff in local_stiffeners:
-            stiffeners.append(
-                BRepBuilderAPI_Transform(stiff, trsf).Shape()
-            )
 
-    return girders, stiffeners
 
+# Number of footpaths (each with its railing) per footpath configuration
+FOOTPATH_SIDES = {
+    "NONE": 0,
+    "LEFT": 1,
+    "RIGHT": 1,
+    "BOTH": 2,
+}
 
 
 def calculate_deck_width(footpath_config):
@@ -189,99 +241,158 @@ def calculate_deck_width(footpath_config):
     - Crash barriers (at carriageway edges)
     - Footpaths (if present)
     - Railings (at deck edges, if footpaths present)
+
+    deck width = carriageway + 2 × crash_barrier_base_width
+                 + n × (footpath + railing),  n = FOOTPATH_SIDES[config]
     
     Returns:
     --------
     total_deck_width : float
     """
-    
-    if footpath_config == "NONE":
-        # carriageway + 2 × crash_barrier_base_width
-        return carriageway_width + 2 * crash_barrier_base_width
-    
-    elif footpath_config == "LEFT" or footpath_config == "RIGHT":
-        # carriageway + 2 × crash_barrier_base_width + footpath + railing
-        return carriageway_width + 2 * crash_barrier_base_width + footpath_width + railing_width
-    
-    elif footpath_config == "BOTH":
-        # carriageway + 2 × crash_barrier_base_width + 2 × footpath + 2 × railing
-        return carriageway_width + 2 * crash_barrier_base_width + 2 * footpath_width + 2 * railing_width
-    
-    else:
-        raise ValueError(f"Invalid footpath_config: {footpath_config}")
+    try:
+        footpath_sides = FOOTPATH_SIDES[footpath_config]
+    except KeyError:
+        raise ValueError(f"Invalid footpath_config: {footpath_config}") from None
+
+    return deck_width(
+        carriageway_width,
+        crash_barrier_base_width,
+        footpath_sides,
+        footpath_width,
+        railing_width
+    )
 
 
-def build_deck():
+def build_deck(geom):
     """
     Builds the deck slab based on footpath configuration.
     Deck is always centered at Y=0.
     """
-    total_deck_width = calculate_deck_width(footpath_config)
-    
     deck = create_deck_slab(
         span_length_L,
-        total_deck_width,
+        geom.deck_width,
         deck_thickness,
         girder_section_d
     )
     return deck
 
 
-def build_cross_bracing():
-    """Builds cross bracing between girders"""
-    cross_bracings = []
+@dataclass(frozen=True, slots=True)
+class BracingParams:
+    """
+    Frozen snapshot of the cross bracing parameters.
+    Passed explicitly to the bracing builders (no global lookups
+    inside the frame loop).
+    """
+    span_length: float
+    bracing_spacing: float
+    num_girders: int
+    girder_spacing: float
+    girder_depth: float
+    flange_thickness: float
+    flange_width: float
+    thickness: float
+    bracing_type: str
+    x_bracket_option: str
+    k_top_bracket: bool
+    section_type: str
+    section_props: object
+
+
+def bracing_params():
+    """Builds BracingParams from the module-level parameters"""
+    return BracingParams(
+        span_length=span_length_L,
+        bracing_spacing=cross_bracing_spacing,
+        num_girders=num_girders,
+        girder_spacing=girder_spacing,
+        girder_depth=girder_section_d,
+        flange_thickness=girder_section_tf,
+        flange_width=girder_section_bf,
+        thickness=cross_bracing_thickness,
+        bracing_type=bracing_type,
+        x_bracket_option=x_bracket_option,
+        k_top_bracket=k_top_bracket,
+        section_type=cross_bracing_section_type,
+        section_props=cross_bracing_section_props,
+    )
 
-    # Number of bracing frames along span
-    n = int(span_length_L / cross_bracing_spacing) - 1
-    n_total = n + 2
-    spacing = span_length_L / (n_total - 1)
-    x_positions = [i * spacing for i in range(n_total)]
-
-    total_width = (num_girders - 1) * girder_spacing
-
-    for x in x_positions:
-        for g in range(num_girders - 1):
-
-            y_left = (g * girder_spacing) - total_width / 2
-            y_right = ((g + 1) * girder_spacing) - total_width / 2
-
-            if bracing_type == "X":
-                cross_bracings.extend(
-                    create_x_bracing_between_girders(
-                        x=x,
-                        y_left=y_left,
-                        y_right=y_right,
-                        girder_depth=girder_section_d,
-                        flange_thickness=girder_section_tf,
-                        thickness=cross_bracing_thickness,
-                        flange_width=girder_section_bf,
-                        bracket_option=x_bracket_option,
-                        section_type=cross_bracing_section_type,
-                        section_props=cross_bracing_section_props
-                    )
-                )
 
-            elif bracing_type == "K":
-                cross_bracings.extend(
-                    create_k_bracing_between_girders(
-                        x=x,
-                        y_left=y_left,
-                        y_right=y_right,
-                        girder_depth=girder_section_d,
-                        flange_thickness=girder_section_tf,
-                        thickness=cross_bracing_thickness,
-                        flange_width=girder_section_bf,
-                        top_bracket=k_top_bracket,
-                        section_type=cross_bracing_section_type,
-                        section_props=cross_bracing_section_props
-                    )
-                )
+def bracing_frame_builder(p):
+    """
+    Returns builder(x, y_left, y_right) for one bracing frame between
+    two adjacent girders. The bracing type is dispatched here, once,
+    instead of for every frame.
+    """
+    common = dict(
+        girder_depth=p.girder_depth,
+        flange_thickness=p.flange_thickness,
+        thickness=p.thickness,
+        flange_width=p.flange_width,
+        section_type=p.section_type,
+        section_props=p.section_props
+    )
+
+    if p.bracing_type == "X":
+        return partial(
+            create_x_bracing_between_girders,
+            bracket_option=p.x_bracket_option,
+            **common
+        )
+
+    elif p.bracing_type == "K":
+        return partial(
+            create_k_bracing_between_girders,
+            top_bracket=p.k_top_bracket,
+            **common
+        )
+
+    else:
+        raise ValueError(
+            f"Invalid bracing_type '{p.bracing_type}'. "
+            "Allowed values are 'X' or 'K'."
+        )
 
-            else:
-                raise ValueError(
-                    f"Invalid bracing_type '{bracing_type}'. "
-                    "Allowed values are 'X' or 'K'."
-                )
+
+def build_cross_bracing(p=None):
+    """
+    Builds cross bracing between girders.
+
+    Every frame is the same geometry up to a translation, so one unit
+    frame (x = 0, left girder at y = 0) is built per distinct bay width
+    and placed as located copies sharing its BRep.
+    """
+    if p is None:
+        p = bracing_params()
+
+    build_frame = bracing_frame_builder(p)
+    cross_bracings = []
+
+    # Bracing frames along span + adjacent girder pairs
+    x_positions, y_lefts, y_rights = bracing_layout(
+        p.span_length,
+        p.bracing_spacing,
+        p.num_girders,
+        p.girder_spacing
+    )
+    girder_pairs = list(zip(y_lefts.tolist(), y_rights.tolist()))
+
+    unit_frames = {}
+    trsf = gp_Trsf()
+    offset = gp_Vec(0, 0, 0)
+
+    for x in x_positions.tolist():
+        for y_left, y_right in girder_pairs:
+            bay_width = round(y_right - y_left, 6)
+            if bay_width not in unit_frames:
+                unit_frames[bay_width] = build_frame(0.0, 0.0, bay_width)
+
+            offset.SetCoord(x, y_left, 0)
+            trsf.SetTranslation(offset)
+            location = TopLoc_Location(trsf)
+            cross_bracings.extend(
+                brace.Moved(location) for brace in unit_frames[bay_width]
+            )
 
     return cross_bracings
 
@@ -317,7 +428,27 @@ def calculate_carriageway_offset(footpath_config):
     
 
 
-def build_crash_barrier(deck_top_z):
+@dataclass(frozen=True, slots=True)
+class DerivedGeometry:
+    """
+    Geometry derived from the parameters.
+    Computed once per build and shared by all build_* functions.
+    """
+    deck_width: float
+    deck_top_z: float
+    carriageway_offset: float
+
+
+def derive_geometry():
+    """Computes the DerivedGeometry for the current parameters"""
+    return DerivedGeometry(
+        deck_width=calculate_deck_width(footpath_config),
+        deck_top_z=girder_section_d + deck_thickness,
+        carriageway_offset=calculate_carriageway_offset(footpath_config),
+    )
+
+
+def build_crash_barrier(geom):
     """
     Builds crash barriers based on footpath configuration.
     
@@ -326,170 +457,51 @@ def build_crash_barrier(deck_top_z):
     
     Logic:
     - Carriageway position is calculated based on footpath config
-    - Crash barriers are placed at carriageway edges
-    - If no footpath on a side, crash barrier extends to deck edge
+    - Side WITH footpath    → barrier at carriageway edge (before footpath)
+    - Side WITHOUT footpath → barrier at deck edge
     """
     crash_barriers = []
 
-    # Get deck dimensions
-    total_deck_width = calculate_deck_width(footpath_config)
-    deck_half_width = total_deck_width / 2
-    
-    # Get carriageway position (offset from Y=0)
-    carriageway_offset = calculate_carriageway_offset(footpath_config)
-    carriageway_half_width = carriageway_width / 2
-    
-    # Calculate carriageway edges in global coordinates
-    carriageway_right_edge = carriageway_offset + carriageway_half_width
-    carriageway_left_edge = carriageway_offset - carriageway_half_width
-    
-    # CASE 1: NO FOOTPATH
-    # Both barriers at deck edges (carriageway = full deck width)
-    if footpath_config == "NONE":
-        # Right crash barrier at deck edge
-        barrier_right = create_crash_barrier_right(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_right = deck_half_width - crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_right,
-                x=0,
-                y=barrier_y_right,
-                z=deck_top_z
-            )
-        )
-        
-        # Left crash barrier at deck edge
-        barrier_left = create_crash_barrier_left(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_left = -deck_half_width + crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_left,
-                x=0,
-                y=barrier_y_left,
-                z=deck_top_z
-            )
-        )
-    
-    # CASE 2: LEFT FOOTPATH ONLY
-    # Left: barrier at carriageway edge (before footpath)
-    # Right: barrier at deck edge (no footpath)
-    elif footpath_config == "LEFT":
-        # Right side: NO footpath → crash barrier at DECK EDGE
-        barrier_right = create_crash_barrier_right(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_right = deck_half_width - crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_right,
-                x=0,
-                y=barrier_y_right,
-                z=deck_top_z
-            )
-        )
-        
-        # Left side: HAS footpath → crash barrier at CARRIAGEWAY EDGE
-        barrier_left = create_crash_barrier_left(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_left = carriageway_left_edge - crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_left,
-                x=0,
-                y=barrier_y_left,
-                z=deck_top_z
-            )
-        )
-    
-    # CASE 3: RIGHT FOOTPATH ONLY
-    # Left: barrier at deck edge (no footpath)
-    # Right: barrier at carriageway edge (before footpath)
-    elif footpath_config == "RIGHT":
-        # Left side: NO footpath → crash barrier at DECK EDGE
-        barrier_left = create_crash_barrier_left(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_left = -deck_half_width + crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_left,
-                x=0,
-                y=barrier_y_left,
-                z=deck_top_z
-            )
-        )
-        
-        # Right side: HAS footpath → crash barrier at CARRIAGEWAY EDGE
-        barrier_right = create_crash_barrier_right(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_right = carriageway_right_edge + crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_right,
-                x=0,
-                y=barrier_y_right,
-                z=deck_top_z
-            )
-        )
-    
-    # CASE 4: BOTH FOOTPATHS
-    # Both barriers at carriageway edges (symmetric)
-    elif footpath_config == "BOTH":
-        # Right crash barrier at carriageway edge
-        barrier_right = create_crash_barrier_right(
-            length=span_length_L,
-            width=crash_barrier_width,
-            height=crash_barrier_height,
-            base_width=crash_barrier_base_width
-        )
-        barrier_y_right = carriageway_right_edge + crash_barrier_base_width / 2
-        crash_barriers.append(
-            place_crash_barrier(
-                barrier_right,
-                x=0,
-                y=barrier_y_right,
-                z=deck_top_z
-            )
-        )
+    # Barrier center Y at the deck edge / carriageway edge of each side
+    (
+        left_at_deck_edge,
+        left_at_carriageway_edge,
+        right_at_deck_edge,
+        right_at_carriageway_edge
+    ) = barrier_offsets(
+        geom.deck_width,
+        geom.carriageway_offset,
+        carriageway_width,
+        crash_barrier_base_width
+    )
 
-        # Left crash barrier at carriageway edge
-        barrier_left = create_crash_barrier_left(
+    # Barrier center Y per side: (at deck edge, at carriageway edge)
+    edge_table = {
+        "LEFT": (left_at_deck_edge, left_at_carriageway_edge),
+        "RIGHT": (right_at_deck_edge, right_at_carriageway_edge),
+    }
+
+    barrier_builders = {
+        "LEFT": create_crash_barrier_left,
+        "RIGHT": create_crash_barrier_right,
+    }
+
+    for side in ("RIGHT", "LEFT"):
+        has_footpath = footpath_config in (side, "BOTH")
+        at_deck_edge, at_carriageway_edge = edge_table[side]
+
+        barrier = barrier_builders[side](
             length=span_length_L,
             width=crash_barrier_width,
             height=crash_barrier_height,
             base_width=crash_barrier_base_width
         )
-        barrier_y_left = carriageway_left_edge - crash_barrier_base_width / 2
         crash_barriers.append(
             place_crash_barrier(
-                barrier_left,
+                barrier,
                 x=0,
-                y=barrier_y_left,
-                z=deck_top_z
+                y=at_carriageway_edge if has_footpath else at_deck_edge,
+                z=geom.deck_top_z
             )
         )
 
@@ -497,10 +509,12 @@ def build_crash_barrier(deck_top_z):
 
 
 
-def build_railing(deck_top_z):
+def build_railing(geom, preview=False):
     """
     Builds railings at DECK EDGES based on footpath configuration.
     Railings only exist where footpaths exist.
+
+    preview=True builds the boolean-free display railing.
     """
     railings = []
 
@@ -513,69 +527,261 @@ def build_railing(deck_top_z):
         length=span_length_L,
         width=railing_width,
         height=railing_height,
-        rail_count=rail_count
+        rail_count=rail_count,
+        preview=preview
     )
 
-    # Calculate deck edge position
-    total_deck_width = calculate_deck_width(footpath_config)
-    deck_half_width = total_deck_width / 2
-
-    # LEFT FOOTPATH - Railing at left deck edge
-    if footpath_config == "LEFT" or footpath_config == "BOTH":
-        railing_y_left = -(deck_half_width - railing_width / 2)
-        railings.append(
-            place_railing(
-                base_railing,
-                x=span_length_L / 2,
-                y=railing_y_left,
-                z=deck_top_z
-            )
-        )
-
-    # RIGHT FOOTPATH - Railing at right deck edge
-    if footpath_config == "RIGHT" or footpath_config == "BOTH":
-        railing_y_right = deck_half_width - railing_width / 2
-        railings.append(
-            place_railing(
-                base_railing,
-                x=span_length_L / 2,
-                y=railing_y_right,
-                z=deck_top_z
+    # Railing center Y at each deck edge
+    railing_y = geom.deck_width / 2 - railing_width / 2
+    edge_table = {"LEFT": -railing_y, "RIGHT": railing_y}
+
+    for side in ("LEFT", "RIGHT"):
+        if footpath_config in (side, "BOTH"):
+            railings.append(
+                place_railing(
+                    base_railing,
+                    x=span_length_L / 2,
+                    y=edge_table[side],
+                    z=geom.deck_top_z
+                )
             )
-        )
 
     return railings
 
 
+@lru_cache(maxsize=None)
+def quantity_color(rgb):
+    """Palette: one shared Quantity_Color per RGB tuple"""
+    return Quantity_Color(*rgb, Quantity_TOC_RGB)
+
+
 def display_colored(display, shape, rgb):
-    """Helper function to display shapes with color"""
-    display.DisplayShape(
-        shape,
-        color=Quantity_Color(*rgb, Quantity_TOC_RGB),
-        update=False
+    """
+    Helper function to display shapes with color.
+    Registers the AIS_Shape with the context directly (no redraw);
+    the viewer is updated once after everything has been added.
+    """
+    ais = AIS_Shape(shape)
+    ais.SetColor(quantity_color(rgb))
+    display.Context.Display(ais, False)
+
+
+def group_instances(shapes, max_templates=8):
+    """
+    Groups shapes that are placed copies of the same BRep
+    (same TShape, different location).
+
+    Returns a list of (template, instances) pairs, or None when the
+    shapes do not come from a small set of shared templates.
+    """
+    groups = []
+    for shape in shapes:
+        for template, instances in groups:
+            if shape.IsPartner(template):
+                instances.append(shape)
+                break
+        else:
+            if len(groups) == max_templates:
+                return None
+            groups.append((shape, [shape]))
+
+    return groups
+
+
+def display_instanced(display, shapes, rgb):
+    """
+    Displays shapes through AIS_MultipleConnectedInteractive when they
+    are instances of shared templates: each template gets ONE
+    presentation (one triangulation / VBO) drawn once per placement.
+    Falls back to a single compound otherwise.
+    """
+    groups = group_instances(shapes)
+    if groups is None or len(groups) == len(shapes):
+        display_colored(display, make_compound(shapes), rgb)
+        return
+
+    display_connected(
+        display,
+        [
+            (
+                template.Located(TopLoc_Location()),
+                [shape.Location().Transformation() for shape in instances]
+            )
+            for template, instances in groups
+        ],
+        rgb
     )
 
 
-def assemble_bridge():
-    """Assembles all bridge components"""
-    girders, stiffeners = build_girders()
-    cross_bracings = build_cross_bracing()
-    deck = build_deck()
-    deck_top_z = girder_section_d + deck_thickness
-    crash_barriers = build_crash_barrier(deck_top_z)
-    railings = build_railing(deck_top_z)
+def display_placements(display, placements, rgb):
+    """
+    Displays a Placements template as connected instances,
+    without materializing the placed shapes.
+    """
+    transforms = []
+    for x, y, z in placements.offsets.tolist():
+        trsf = gp_Trsf()
+        trsf.SetTranslation(gp_Vec(x, y, z))
+        transforms.append(trsf)
 
-    median_barriers = []
-    if enable_median:
-        carriageway_center_y = calculate_carriageway_offset(footpath_config)
-        median_barriers = create_median_barriers(
-            length=span_length_L,
-            barrier_width=crash_barrier_width,
-            barrier_height=crash_barrier_height,
-            barrier_base_width=crash_barrier_base_width,
-            deck_top_z=deck_top_z,
-            carriageway_center_y=carriageway_center_y,
-            median_gap=median_gap
+    display_connected(display, [(placements.base_shape, transforms)], rgb)
+
+
+def display_connected(display, templates, rgb):
+    """
+    templates: list of (template_shape, [gp_Trsf per placement]).
+    Each template gets one AIS_Shape, connected once per placement
+    into a single AIS_MultipleConnectedInteractive.
+    """
+    color = quantity_color(rgb)
+    multi = AIS_MultipleConnectedInteractive()
+
+    for template, transforms in templates:
+        master = AIS_Shape(template)
+        master.SetColor(color)
+        for trsf in transforms:
+            multi.Connect(master, trsf)
+
+    display.Context.Display(multi, False)
+
+
+def make_compound(shapes):
+    """
+    Groups shapes into a single TopoDS_Compound so they can be
+    displayed (and triangulated) as one AIS presentation.
+    """
+    compound = TopoDS_Compound()
+    builder = BRep_Builder()
+    builder.MakeCompound(compound)
+    for shape in shapes:
+        builder.Add(compound, shape)
+    return compound
+
+
+def build_deck_texture(geom):
+    """
+    Generates the deck texture, pre-meshes it and splits it into tiles.
+    Returns a list of tiles (lists of shapes).
+    """
+    texture_shapes = place_deck_texture(
+        deck_length=span_length_L,
+        deck_width=geom.deck_width,
+        deck_thickness=deck_thickness,
+        deck_top_z=geom.deck_top_z,
+        density=texture_density
+    )
+
+    # Triangulate the whole texture once, coarsely and in parallel,
+    # so the viewer does not mesh every element on first display
+    mesh_all(texture_shapes, deflection=texture_mesh_deflection)
+
+    return split_into_tiles(texture_shapes, texture_tile_length)
+
+
+def split_into_tiles(shapes, tile_length):
+    """
+    Buckets shapes into tiles along X (by bounding-box center).
+
+    Each tile is displayed as its own presentation, so the viewer's
+    frustum culling can skip tiles that are off-screen; one compound
+    spanning the whole deck is never culled.
+    """
+    tiles = {}
+    for shape in shapes:
+        box = Bnd_Box()
+        brepbndlib.Add(shape, box)
+        x_min, _, _, x_max, _, _ = box.Get()
+        index = int(((x_min + x_max) / 2) // tile_length)
+        tiles.setdefault(index, []).append(shape)
+
+    return [tiles[i] for i in sorted(tiles)]
+
+
+def mesh_all(shapes, deflection=None, angular_deflection=0.5):
+    """
+    Triangulates all shapes in one parallel BRepMesh_IncrementalMesh pass.
+    Meshes are stored on the (shared) faces, so instanced shapes
+    are only meshed once.
+    """
+    if deflection is None:
+        deflection = mesh_deflection
+
+    BRepMesh_IncrementalMesh(
+        make_compound(shapes),
+        deflection,
+        False,
+        angular_deflection,
+        True
+    )
+
+
+def build_median_barriers(geom):
+    """
+    Builds median barriers at the carriageway center (if enabled).
+    """
+    if not enable_median:
+        return []
+
+    return create_median_barriers(
+        length=span_length_L,
+        barrier_width=crash_barrier_width,
+        barrier_height=crash_barrier_height,
+        barrier_base_width=crash_barrier_base_width,
+        deck_top_z=geom.deck_top_z,
+        carriageway_center_y=geom.carriageway_offset,
+        median_gap=median_gap
+    )
+
+
+def assemble_bridge(geom=None, mesh=True):
+    """
+    Assembles all bridge components.
+
+    With build_workers = 1 (default) the build_* functions run one after
+    the other. Larger values run them on a thread pool; the crash
+    barriers are built first, serially, so their cached templates
+    (shared with the median barriers) are filled before any worker
+    starts and no two threads fill the same cache entry.
+
+    mesh=False skips the display triangulation (headless export).
+    Display builds (mesh=True) use the boolean-free preview railing.
+    """
+    if geom is None:
+        geom = derive_geometry()
+
+    crash_barriers = build_crash_barrier(geom)
+
+    if build_workers <= 1:
+        girders, stiffeners = build_girders()
+        cross_bracings = build_cross_bracing(bracing_params())
+        deck = build_deck(geom)
+        railings = build_railing(geom, preview=mesh)
+        median_barriers = build_median_barriers(geom)
+    else:
+        # Remaining builders use disjoint caches
+        with ThreadPoolExecutor(max_workers=build_workers) as pool:
+            girders_job = pool.submit(build_girders)
+            cross_bracings_job = pool.submit(
+                build_cross_bracing, bracing_params()
+            )
+            deck_job = pool.submit(build_deck, geom)
+            railings_job = pool.submit(build_railing, geom, preview=mesh)
+            median_barriers_job = pool.submit(build_median_barriers, geom)
+
+            girders, stiffeners = girders_job.result()
+            cross_bracings = cross_bracings_job.result()
+            deck = deck_job.result()
+            railings = railings_job.result()
+            median_barriers = median_barriers_job.result()
+
+    # Triangulate everything up front (multi-threaded) so that
+    # DisplayShape can reuse the meshes instead of meshing lazily
+    # (girders/stiffeners: meshing the templates meshes every placement)
+    if mesh:
+        mesh_all(
+            [girders.base_shape, stiffeners.base_shape]
+            + cross_bracings + [deck]
+            + crash_barriers + railings + median_barriers
         )
 
     return (
@@ -589,10 +795,78 @@ def assemble_bridge():
     )
 
 
+def assembly_compound(
+    girders,
+    stiffeners,
+    cross_bracings,
+    deck,
+    crash_barriers,
+    railings,
+    median_barriers
+):
+    """
+    Single root compound of the assembled bridge (for export):
+    one sub-compound per component category. Girders and stiffeners
+    are located instances of their templates, so the writer sees
+    one shared BRep per template.
+    """
+    return make_compound([
+        make_compound(materialize(girders)),
+        make_compound(materialize(stiffeners)),
+        make_compound(cross_bracings),
+        deck,
+        make_compound(crash_barriers + median_barriers),
+        make_compound(railings),
+    ])
 
 
-def main():
-    """Main function to build and display the bridge"""
+# Viewer created by get_display() (one per process)
+_DISPLAY = None
+
+
+def get_display():
+    """
+    Loads the Qt backend and creates the viewer on first use,
+    returns the same init_display() result on every later call.
+    Qt is only imported when something is actually displayed.
+    """
+    global _DISPLAY
+    if _DISPLAY is None:
+        from OCC.Display.backend import load_backend
+        load_backend("pyside6")
+        from OCC.Display.SimpleGui import init_display
+        _DISPLAY = init_display()
+    return _DISPLAY
+
+
+def export_step(shape, path):
+    """
+    Writes shape to a STEP file.
+
+    Compounds are written as assemblies, so shapes sharing a BRep
+    (located copies of one template) are written once as a part
+    and referenced per placement.
+    """
+    # Data exchange modules are only loaded when exporting
+    from OCC.Core.STEPControl import STEPControl_Writer, STEPControl_AsIs
+    from OCC.Core.IFSelect import IFSelect_RetDone
+    from OCC.Core.Interface import Interface_Static
+
+    # (the writer registers the write.step.* parameters)
+    writer = STEPControl_Writer()
+    Interface_Static.SetIVal("write.step.assembly", 1)
+    writer.Transfer(shape, STEPControl_AsIs)
+    if writer.Write(path) != IFSelect_RetDone:
+        raise RuntimeError(f"Failed to write STEP file: {path}")
+
+
+def main(headless=False, step_path="bridge.step"):
+    """
+    Main function to build and display the bridge.
+
+    headless=True skips the viewer (no Qt import, no meshing)
+    and writes the model to step_path instead.
+    """
 
     # Validate inputs
     validate_bridge_inputs(
@@ -604,9 +878,8 @@ def main():
         footpath_config=footpath_config,
     )
 
-    # Calculate dimensions
-    total_deck_width = calculate_deck_width(footpath_config)
-    carriageway_offset = calculate_carriageway_offset(footpath_config)
+    # Calculate dimensions (once, shared by all builders)
+    geom = derive_geometry()
 
     # Print configuration
     print("=" * 60)
@@ -615,20 +888,24 @@ def main():
     print(f"Footpath Configuration: {footpath_config}")
     print(f"Carriageway Width: {carriageway_width} mm")
     if footpath_config in ["LEFT", "RIGHT"]:
-        print(f"Carriageway Offset from Center: {carriageway_offset:+.1f} mm")
+        print(f"Carriageway Offset from Center: {geom.carriageway_offset:+.1f} mm")
     print(f"Crash Barrier Base Width: {crash_barrier_base_width} mm")
     if footpath_config != "NONE":
         print(f"Footpath Width: {footpath_width} mm")
         print(f"Railing Width: {railing_width} mm")
-    print(f"Total Deck Width: {total_deck_width} mm")
+    print(f"Total Deck Width: {geom.deck_width} mm")
     print(f"\nNumber of Girders: {num_girders}")
     print(f"Girder Spacing: {girder_spacing} mm")
     print("=" * 60)
 
-    # Initialize display
-    display, start_display, add_menu, add_function_to_menu = init_display()
-
     # Assemble bridge components
+    parts = assemble_bridge(geom, mesh=not headless)
+
+    if headless:
+        export_step(assembly_compound(*parts), step_path)
+        print(f"STEP written to {step_path}")
+        return
+
     (
         girders,
         stiffeners,
@@ -637,53 +914,49 @@ def main():
         crash_barriers,
         railings,
         median_barriers
-    ) = assemble_bridge()
-
-
-    # Display girders
-    for g in girders:
-        display_colored(display, g, COLOR_GIRDER)
-
-    for s in stiffeners:
-        display_colored(display, s, COLOR_STIFFENER)
-
-    # Display cross bracings
-    for cb in cross_bracings:
-        display_colored(display, cb, COLOR_CROSS_BRACING)
-
-    # Display deck slab (CRITICAL)
-    display_colored(display, deck, COLOR_DECK)
-
-
-    # Generate & display deck texture
-    deck_top_z = girder_section_d + deck_thickness
-
-    texture_shapes = place_deck_texture(
-        deck_length=span_length_L,
-        deck_width=total_deck_width,
-        deck_thickness=deck_thickness,
-        deck_top_z=deck_top_z
-    )
-
-    for s in texture_shapes:
-        display.DisplayShape(s, color=texture_color, update=False)
-
+    ) = parts
+
+    # Shapes grouped by display color
+    # (median barriers share the crash barrier color)
+    color_groups = [
+        (cross_bracings, COLOR_CROSS_BRACING),
+        ([deck], COLOR_DECK),
+        (crash_barriers + median_barriers, COLOR_CRASH_BARRIER),
+        (railings, COLOR_RAILING),
+    ]
+
+    if use_vtk:
+        from vtk_viewer import render_vtk
+        texture_tiles = build_deck_texture(geom)
+        render_vtk(
+            [
+                (materialize(girders), COLOR_GIRDER),
+                (materialize(stiffeners), COLOR_STIFFENER),
+            ]
+            + color_groups
+            + [(tile, COLOR_TEXTURE) for tile in texture_tiles]
+        )
+        return
 
-    # Display crash barriers
-    for cb in crash_barriers:
-        display_colored(display, cb, COLOR_CRASH_BARRIER)
+    # Initialize display
+    display, start_display, add_menu, add_function_to_menu = get_display()
+    from PySide6.QtCore import Qt
 
-    # Display railings
-    for r in railings:
-        display_colored(display, r, COLOR_RAILING)
+    # Girders and stiffeners: one presentation per template,
+    # drawn once per girder placement
+    display_placements(display, girders, COLOR_GIRDER)
+    display_placements(display, stiffeners, COLOR_STIFFENER)
 
-    for m in median_barriers:
-        display_colored(display, m, COLOR_CRASH_BARRIER)
+    # Each color group is displayed as ONE AIS object: instanced when
+    # its shapes share templates, else a compound.
+    for shapes, rgb in color_groups:
+        if shapes:
+            display_instanced(display, shapes, rgb)
 
+    # All presentations added without redraw: update the viewer once
+    display.Context.UpdateCurrentViewer()
 
     # Set up arrow key panning
-    from PySide6.QtCore import Qt
-
     def pan_up():
         display.Pan(0, 50)
     
@@ -717,10 +990,45 @@ def main():
     # Set view and display
     display.View.SetProj(1, 0, 0)
     display.FitAll()
-    display.Repaint()
+
+    texture_shown = False
+
+    def show_deck_texture():
+        # Loaded once: later menu clicks must not stack duplicate tiles
+        nonlocal texture_shown
+        if texture_shown:
+            return
+        texture_shown = True
+
+        for tile in build_deck_texture(geom):
+            display_instanced(display, tile, COLOR_TEXTURE)
+        display.Context.UpdateCurrentViewer()
+
+    # Deck texture LOD: if texture elements would be smaller than
+    # texture_min_pixels in the initial view, do not build them at all
+    # (the plain deck color is shown); they can be loaded from the menu.
+    if display.View.Convert(float(TRI_SIZE_MAX)) >= texture_min_pixels:
+        show_deck_texture()
+    else:
+        add_menu("View")
+        add_function_to_menu("View", show_deck_texture)
+        display.Repaint()
 
     start_display()
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    parser = argparse.ArgumentParser(description="Steel girder bridge model")
+    parser.add_argument(
+        "--headless",
+        action="store_true",
+        help="do not open the viewer, export the model to STEP instead"
+    )
+    parser.add_argument(
+        "--step",
+        default="bridge.step",
+        help="STEP output path for --headless (default: bridge.step)"
+    )
+    args = parser.parse_args()
+
+    main(headless=args.headless, step_path=args.step)
\ No newline at end of file
@@ -7,6 +7,8 @@
 #   - slope 1: 250 mm reduction till Z = 350
 #   - slope 2: extra 50 mm reduction till full height
 
+from functools import lru_cache
+
 from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Trsf, gp_Dir, gp_Ax2
 from OCC.Core.BRepBuilderAPI import (
     BRepBuilderAPI_MakePolygon,
@@ -14,13 +16,18 @@ from OCC.Core.BRepBuilderAPI import (
     BRepBuilderAPI_Transform
 )
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakePrism
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 # Utility transforms
 def translate(shape, x=0, y=0, z=0):
+    """Located copy of shape (shares its BRep, no builder pass)"""
+    if x == 0 and y == 0 and z == 0:
+        return shape
+
     trsf = gp_Trsf()
     trsf.SetTranslation(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(shape, trsf, True).Shape()
+    return shape.Moved(TopLoc_Location(trsf))
 
 
 def mirror_y(shape):
@@ -32,55 +39,48 @@ def mirror_y(shape):
     return BRepBuilderAPI_Transform(shape, trsf, True).Shape()
 
 
-def create_crash_barrier_left(
-    length,
-    width,       
-    height,      
-    base_width   
-):
-   
+def crash_barrier_profile(width, height, base_width):
+    """
+    LEFT crash barrier outline in the YZ plane, as (y, z) points
+    (clockwise, centered on Y = 0).
+    """
 
     # Heights (mm)
     base_h = 100.0
     slope1_end_z = 325.0      # end of first gentle slope
     slope2_start_z = 325.0    # start of final slope
 
-    # Z levels
-    z0 = 0.0
-    z1 = base_h
-    z2 = slope1_end_z
-    z3 = slope2_start_z
-    z4 = height
-
-    # Bottom width
-    y_left_base  = -base_width / 2.0
-    y_right_base =  base_width / 2.0
-
-    # Top width 
-    y_left_top  = -width / 2.0
-    y_right_top =  width / 2.0
-
     # Intermediate width = 250
     mid_width = 250.0
-    y_right_mid =  mid_width / 2.0
 
-    # Profile points (YZ plane)
-    # Clockwise
-    p1 = gp_Pnt(0, y_right_base, z0)   # bottom right
-    p2 = gp_Pnt(0, y_left_base,  z0)   # bottom left
+    return (
+        ( base_width / 2.0, 0.0),             # bottom right
+        (-base_width / 2.0, 0.0),             # bottom left
+        (-base_width / 2.0, base_h),          # base vertical (left)
+        (-width / 2.0,      height),          # left gentle slope
+        ( width / 2.0,      height),          # top right
+        ( mid_width / 2.0,  slope2_start_z),  # start final slope
+        ( mid_width / 2.0,  slope1_end_z),
+        ( base_width / 2.0, base_h),          # base vertical (right)
+    )
 
-    p3 = gp_Pnt(0, y_left_base,  z1)   # base vertical (left)
-    p4 = gp_Pnt(0, y_left_top,   z4)   # left gentle slope
 
-    p5 = gp_Pnt(0, y_right_top,  z4)   # top right
-    p6 = gp_Pnt(0, y_right_mid,  z3)   # start final slope
-    p7 = gp_Pnt(0, y_right_mid,  z2) 
-    p8 = gp_Pnt(0, y_right_base, z1)   # base vertical (right)
+@lru_cache(maxsize=16)
+def create_crash_barrier_left(
+    length,
+    width,       
+    height,      
+    base_width   
+):
+    """
+    Extrudes crash_barrier_profile() along +X.
+    Cached per parameter set; place the result with place_crash_barrier().
+    """
 
     # Build face
     poly = BRepBuilderAPI_MakePolygon()
-    for p in (p1, p2, p3, p4, p5, p6, p7, p8):
-        poly.Add(p)
+    for y, z in crash_barrier_profile(width, height, base_width):
+        poly.Add(gp_Pnt(0, y, z))
     poly.Close()
 
     face = BRepBuilderAPI_MakeFace(poly.Wire()).Face()
@@ -97,6 +97,7 @@ def create_crash_barrier_left(
 
 # RIGHT crash barrier (mirror of LEFT)
 
+@lru_cache(maxsize=16)
 def create_crash_barrier_right(
     length,
     width,
@@ -1,10 +1,16 @@
-from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Trsf, gp_Ax1, gp_Dir
+import math
+
+from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Trsf, gp_Ax1, gp_Ax3, gp_Dir
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
 
 from sections.section_factory import create_section_solid
 from sections.section_database import get_section_roll_angle
 
 
+# Shared constant geometry (gp_Pnt / gp_Dir are copied by value on use)
+_ORIGIN = gp_Pnt(0, 0, 0)
+_X_DIR = gp_Dir(1, 0, 0)
+_Z_DIR = gp_Dir(0, 0, 1)
 
 
 def create_diagonal_member(
@@ -20,8 +26,10 @@ def create_diagonal_member(
     Geometry behavior is kept IDENTICAL to box implementation.
     """
 
-    vec = gp_Vec(p1, p2)
-    length = vec.Magnitude()
+    dx = p2.X() - p1.X()
+    dy = p2.Y() - p1.Y()
+    dz = p2.Z() - p1.Z()
+    length = math.hypot(dx, dy, dz)
 
     # 1. CREATE GEOMETRY (SECTION-AGNOSTIC)
 
@@ -34,19 +42,21 @@ def create_diagonal_member(
 
 
     # 2. ROTATE FROM +X TO TARGET VECTOR
-
-    x_dir = gp_Dir(1, 0, 0)
-    target_dir = gp_Dir(vec)
-    axis_vec = gp_Vec(x_dir.Crossed(target_dir))
-    angle = x_dir.Angle(target_dir)
-
-    if axis_vec.Magnitude() > 1e-6:
-        trsf_rot = gp_Trsf()
-        trsf_rot.SetRotation(
-            gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(axis_vec)),
-            angle
-        )
-        solid = BRepBuilderAPI_Transform(solid, trsf_rot, True).Shape()
+    # (rotation, roll and translation are composed into ONE gp_Trsf
+    # and applied in a single transform pass)
+
+    # Frame-to-frame displacement: rotates about the axis normal to
+    # +X and the member (the same minimal rotation as axis + angle),
+    # without trig. Members along X fall back to the Z axis.
+    target_dir = gp_Dir(dx, dy, dz)
+    axis_vec = gp_Vec(_X_DIR).Crossed(gp_Vec(target_dir))
+    axis_dir = gp_Dir(axis_vec) if axis_vec.Magnitude() > 1e-6 else _Z_DIR
+
+    trsf_rot = gp_Trsf()
+    trsf_rot.SetDisplacement(
+        gp_Ax3(_ORIGIN, axis_dir, _X_DIR),
+        gp_Ax3(_ORIGIN, axis_dir, target_dir)
+    )
 
 
     # 2B. ROLL CONTROL (ANGLE + CHANNEL)
@@ -59,13 +69,12 @@ def create_diagonal_member(
 
     member_axis_dir = target_dir
 
+    roll_trsf = gp_Trsf()
     if abs(roll_angle) > 1e-6:
-        roll_trsf = gp_Trsf()
         roll_trsf.SetRotation(
-            gp_Ax1(gp_Pnt(0, 0, 0), member_axis_dir),
+            gp_Ax1(_ORIGIN, member_axis_dir),
             roll_angle
         )
-        solid = BRepBuilderAPI_Transform(solid, roll_trsf, True).Shape()
 
 
     # 3. TRANSLATE TO MIDPOINT
@@ -76,10 +85,14 @@ def create_diagonal_member(
         (p1.Z() + p2.Z()) / 2
     )
 
-    trsf_trans = gp_Trsf()
-    trsf_trans.SetTranslation(gp_Vec(mid.X(), mid.Y(), mid.Z()))
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(mid.X(), mid.Y(), mid.Z()))
+
+    # translate ∘ roll ∘ rotate
+    trsf.Multiply(roll_trsf)
+    trsf.Multiply(trsf_rot)
 
-    return BRepBuilderAPI_Transform(solid, trsf_trans, True).Shape()
+    return BRepBuilderAPI_Transform(solid, trsf, False).Shape()
 
 
 def create_diagonal_bracing_between_girders(
@@ -1,10 +1,24 @@
+import math
+
 from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Ax1, gp_Dir, gp_Pnt
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 from sections.section_factory import create_section_solid
 from sections.section_database import get_section_roll_angle
 
+
+# Shared constant geometry (gp_Pnt / gp_Dir are copied by value on use)
+_ORIGIN = gp_Pnt(0, 0, 0)
+_Y_DIR = gp_Dir(0, 1, 0)
+
+# Fixed X → Y alignment of every horizontal member (90° about Z).
+# Only ever used as a Multiply() operand, never modified.
+_ALIGN_X_TO_Y = gp_Trsf()
+_ALIGN_X_TO_Y.SetRotation(gp_Ax1(_ORIGIN, gp_Dir(0, 0, 1)), math.pi / 2)
+
+
 def create_horizontal_member_y(
     x,
     y_left_girder_left_edge,
@@ -32,14 +46,9 @@ def create_horizontal_member_y(
     )
 
 
-    # 2. ALIGN FROM X → Y (HORIZONTAL MEMBER AXIS)
-
-    trsf_align = gp_Trsf()
-    trsf_align.SetRotation(
-        gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 0, 1)),  # rotate about Z
-        1.5708
-    )
-    solid = BRepBuilderAPI_Transform(solid, trsf_align, True).Shape()
+    # 2. ALIGN FROM X → Y (HORIZONTAL MEMBER AXIS): _ALIGN_X_TO_Y
+    # (alignment, roll and placement are composed into ONE gp_Trsf
+    # and applied in a single transform pass)
 
 
     # 2B. ROLL CONTROL (ANGLE + CHANNEL)
@@ -51,15 +60,14 @@ def create_horizontal_member_y(
     )
 
 
-    member_axis_dir = gp_Dir(0, 1, 0)
+    member_axis_dir = _Y_DIR
 
+    roll_trsf = gp_Trsf()
     if abs(roll_angle) > 1e-6:
-        roll_trsf = gp_Trsf()
         roll_trsf.SetRotation(
-            gp_Ax1(gp_Pnt(0, 0, 0), member_axis_dir),
+            gp_Ax1(_ORIGIN, member_axis_dir),
             roll_angle
         )
-        solid = BRepBuilderAPI_Transform(solid, roll_trsf, True).Shape()
 
 
     # 3. FINAL PLACEMENT
@@ -67,4 +75,18 @@ def create_horizontal_member_y(
     trsf = gp_Trsf()
     trsf.SetTranslation(gp_Vec(x, y_mid, z))
 
-    return BRepBuilderAPI_Transform(solid, trsf, True).Shape()
+    # translate ∘ roll ∘ align
+    trsf.Multiply(roll_trsf)
+    trsf.Multiply(_ALIGN_X_TO_Y)
+
+    return BRepBuilderAPI_Transform(solid, trsf, False).Shape()
+
+
+def raise_member(member, dz):
+    """
+    Copy of member moved up by dz, sharing its BRep
+    (e.g. the top bracket from the bottom one).
+    """
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(0, 0, dz))
+    return member.Moved(TopLoc_Location(trsf))
@@ -1,6 +1,6 @@
 from OCC.Core.gp import gp_Pnt
 from .diagonal_member import create_diagonal_member
-from .horizontal_member import create_horizontal_member_y
+from .horizontal_member import create_horizontal_member_y, raise_member
 
 
 def create_k_bracing_between_girders(
@@ -94,20 +94,10 @@ def create_k_bracing_between_girders(
     braces.append(bottom_member)
 
 
-    # Optional top bracket
+    # Optional top bracket (bottom bracket moved up)
 
     if top_bracket:
-        top_member = create_horizontal_member_y(
-            x,
-            y_left,
-            y_right,
-            z_top,
-            thickness,
-            flange_width,
-            section_type, 
-            section_props, 
-            roll_sign
-        )
+        top_member = raise_member(bottom_member, z_top - z_bottom)
         braces.append(top_member)
 
     return braces
@@ -1,6 +1,6 @@
 from OCC.Core.gp import gp_Pnt
 from .diagonal_member import create_diagonal_member
-from .horizontal_member import create_horizontal_member_y
+from .horizontal_member import create_horizontal_member_y, raise_member
 
 
 def create_x_bracing_between_girders(
@@ -52,20 +52,20 @@ def create_x_bracing_between_girders(
 )
     braces.extend([d1, d2])
 
-    # Bottom bracket
-    if bracket_option in ("LOWER", "BOTH"):
+    # Horizontal brackets: one member is built, the top bracket is
+    # the bottom one moved up (same length and section)
+    if bracket_option in ("LOWER", "UPPER", "BOTH"):
         bottom_member = create_horizontal_member_y(
             x, y_left, y_right, z_bottom, thickness, flange_width,
             section_type, section_props, roll_sign
         )
-        braces.append(bottom_member)
 
-    # Top bracket
-    if bracket_option in ("UPPER", "BOTH"):
-        top_member = create_horizontal_member_y(
-            x, y_left, y_right, z_top, thickness, flange_width,section_type, section_props, roll_sign
-        )
-        braces.append(top_member)
+        # Bottom bracket
+        if bracket_option in ("LOWER", "BOTH"):
+            braces.append(bottom_member)
 
-    return braces
+        # Top bracket
+        if bracket_option in ("UPPER", "BOTH"):
+            braces.append(raise_member(bottom_member, z_top - z_bottom))
 
+    return braces
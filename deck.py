@@ -1,9 +1,7 @@
 # deck.py
 
-from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-
-from draw_rectangular_prism import create_rectangular_prism
+from OCC.Core.gp import gp_Pnt
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
 
 
 def create_deck_slab(
@@ -32,21 +30,11 @@ def create_deck_slab(
     Positioned deck slab shape
     """
 
-    # Create rectangular prism for deck
-    slab = create_rectangular_prism(
+    # Deck box built directly in position (no transform pass):
+    # X: 0 → span, centered at Y=0, sitting on top of girders
+    return BRepPrimAPI_MakeBox(
+        gp_Pnt(0, -deck_width / 2, girder_depth),
         span_length,
         deck_width,
         deck_thickness
-    )
-
-    # Position deck: centered at Y=0, sitting on top of girders
-    trsf = gp_Trsf()
-    trsf.SetTranslation(
-        gp_Vec(
-            span_length / 2,
-            0,  # Deck centered at Y=0
-            girder_depth
-        )
-    )
-
-    return BRepBuilderAPI_Transform(slab, trsf).Shape()
\ No newline at end of file
+    ).Shape()
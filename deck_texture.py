@@ -12,12 +12,15 @@ from OCC.Core.BRepBuilderAPI import (
     BRepBuilderAPI_MakeFace,
     BRepBuilderAPI_Transform
 )
+from OCC.Core.TopLoc import TopLoc_Location
 from OCC.Core.gp import (
     gp_Pnt, gp_Trsf, gp_Vec,
     gp_Ax1, gp_Dir
 )
-import random
 import math
+from functools import lru_cache
+
+import numpy as np
 
 
 DOT_RADIUS = 6
@@ -25,33 +28,63 @@ DOT_HEIGHT = 3
 
 TRI_SIZE_MAX = 120
 TRI_HEIGHT = 0.4
+TRI_TEMPLATE_COUNT = 8   # distinct triangle shapes per face kind
 
 EDGE_GAP = 15
 Z_GAP = 15
 
+# Triangle rotation axes (copied by value when used)
+_ROT_AX_X = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(1, 0, 0))   # FRONT & BACK faces
+_ROT_AX_Y = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 1, 0))   # LEFT & RIGHT faces
+_HALF_PI = math.pi / 2
+
+
+def _count(n, density):
+    """Number of texture elements for a base count n at given density"""
+    return int(n * density)
+
 
 # Texture primitives
-def _create_dot(x, y, z, radius=DOT_RADIUS, height=DOT_HEIGHT):
-    dot = BRepPrimAPI_MakeCylinder(radius, height).Shape()
+@lru_cache(maxsize=4)
+def _dot_template(radius, height):
+    """One shared cylinder per size; every dot is a located copy of it"""
+    return BRepPrimAPI_MakeCylinder(radius, height).Shape()
+
+
+def _place(shape, x, y, z):
+    """Located copy of shape at (x, y, z), sharing its BRep"""
     trsf = gp_Trsf()
     trsf.SetTranslation(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(dot, trsf, True).Shape()
+    return shape.Moved(TopLoc_Location(trsf))
+
+
+def _create_dot(x, y, z, radius=DOT_RADIUS, height=DOT_HEIGHT):
+    return _place(_dot_template(radius, height), x, y, z)
 
 
 def _create_dot_z(x, y, z, up=True):
     height = DOT_HEIGHT if up else -DOT_HEIGHT
-    dot = BRepPrimAPI_MakeCylinder(DOT_RADIUS, abs(height)).Shape()
-    trsf = gp_Trsf()
-    trsf.SetTranslation(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(dot, trsf, True).Shape()
-
+    return _place(_dot_template(DOT_RADIUS, abs(height)), x, y, z)
+
+
+def _sample_triangles(rng, n):
+    """
+    Random triangle shapes, vectorized:
+    size in [80, TRI_SIZE_MAX], two vertex offsets in [10, size]
+    """
+    sizes = rng.uniform(80, TRI_SIZE_MAX, n)
+    return (
+        sizes,
+        rng.uniform(10, sizes),
+        rng.uniform(10, sizes)
+    )
 
-def _create_triangle(x, y, z, rot_axis=None, rot_angle=0):
-    size = random.uniform(80, TRI_SIZE_MAX)
 
+def _triangle_prism(size, u, v, height, z_offset):
+    """Triangle prism centered on its size × size box in XY"""
     p1 = gp_Pnt(0, 0, 0)
-    p2 = gp_Pnt(size, random.uniform(10, size), 0)
-    p3 = gp_Pnt(random.uniform(10, size), size, 0)
+    p2 = gp_Pnt(size, u, 0)
+    p3 = gp_Pnt(v, size, 0)
 
     poly = BRepBuilderAPI_MakePolygon()
     poly.Add(p1)
@@ -60,110 +93,112 @@ def _create_triangle(x, y, z, rot_axis=None, rot_angle=0):
     poly.Close()
 
     face = BRepBuilderAPI_MakeFace(poly.Wire()).Face()
-    prism = BRepPrimAPI_MakePrism(face, gp_Vec(0, 0, TRI_HEIGHT)).Shape()
+    prism = BRepPrimAPI_MakePrism(face, gp_Vec(0, 0, height)).Shape()
 
-    # center about its own centroid
-    center_trsf = gp_Trsf()
-    center_trsf.SetTranslation(
-        gp_Vec(-size / 2, -size / 2, -TRI_HEIGHT / 2)
+    trsf = gp_Trsf()
+    trsf.SetTranslation(gp_Vec(-size / 2, -size / 2, z_offset))
+    return BRepBuilderAPI_Transform(prism, trsf, False).Shape()
+
+
+@lru_cache(maxsize=4)
+def _triangle_templates(height, z_offset):
+    """
+    TRI_TEMPLATE_COUNT random triangle prisms (fixed seed, so they are
+    the same on every run). Texture triangles are located copies of
+    these instead of one polygon/face/prism build each.
+    """
+    rng = np.random.default_rng(0)
+    sizes, us, vs = _sample_triangles(rng, TRI_TEMPLATE_COUNT)
+    return tuple(
+        _triangle_prism(size, u, v, height, z_offset)
+        for size, u, v in zip(sizes.tolist(), us.tolist(), vs.tolist())
     )
-    prism = BRepBuilderAPI_Transform(prism, center_trsf, True).Shape()
 
+
+def _create_triangle(x, y, z, template, rot_axis=None, rot_angle=0):
+    # rotate + place in one location
     trsf = gp_Trsf()
     if rot_axis:
         trsf.SetRotation(rot_axis, rot_angle)
 
     trsf.SetTranslationPart(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(prism, trsf, True).Shape()
-
-
-def _create_triangle_xy(x, y, z, up=True):
-    size = random.uniform(80, TRI_SIZE_MAX)
-
-    p1 = gp_Pnt(0, 0, 0)
-    p2 = gp_Pnt(size, random.uniform(10, size), 0)
-    p3 = gp_Pnt(random.uniform(10, size), size, 0)
-
-    poly = BRepBuilderAPI_MakePolygon()
-    poly.Add(p1)
-    poly.Add(p2)
-    poly.Add(p3)
-    poly.Close()
-
-    face = BRepBuilderAPI_MakeFace(poly.Wire()).Face()
-    height = TRI_HEIGHT if up else -TRI_HEIGHT
-    prism = BRepPrimAPI_MakePrism(face, gp_Vec(0, 0, height)).Shape()
+    return template.Moved(TopLoc_Location(trsf))
 
-    center_trsf = gp_Trsf()
-    center_trsf.SetTranslation(gp_Vec(-size / 2, -size / 2, 0))
-    prism = BRepBuilderAPI_Transform(prism, center_trsf, True).Shape()
 
-    trsf = gp_Trsf()
-    trsf.SetTranslation(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(prism, trsf, True).Shape()
+def _create_triangle_xy(x, y, z, template):
+    return _place(template, x, y, z)
 
 
 def generate_deck_texture(
     deck_length,
     deck_width,
-    deck_thickness
+    deck_thickness,
+    density=1.0,
+    seed=None,
+    origin=(0.0, 0.0, 0.0)
 ):
+    """
+    density scales the number of dots/triangles on every face
+    (1.0 = full detail, 0.0 = no texture).
+
+    All random positions / triangle picks of a face are sampled at once
+    with NumPy; the Python loops only place the shared dot / triangle
+    templates. seed makes the texture reproducible.
+
+    origin is the position of the deck corner (x=0, y=0, z=0 of the
+    texture): elements are created directly at their final position.
+    """
+    rng = np.random.default_rng(seed)
+    ox, oy, oz = origin
     elements = []
 
     z_min = Z_GAP
     z_max = deck_thickness - Z_GAP - max(DOT_HEIGHT, TRI_HEIGHT)
 
-    # FRONT & BACK (Y faces)
-    rot_y = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(1, 0, 0))
+    # Side-face triangles are centered in Z (rotated onto the face)
+    side_triangles = _triangle_templates(TRI_HEIGHT, -TRI_HEIGHT / 2)
 
+    # FRONT & BACK (Y faces)
     for y in (0.2, deck_width - 0.2):
-        for _ in range(120):
-            elements.append(
-                _create_dot(
-                    random.uniform(EDGE_GAP, deck_length - EDGE_GAP),
-                    y,
-                    random.uniform(z_min, z_max)
-                )
-            )
+        n = _count(120, density)
+        xs = rng.uniform(EDGE_GAP, deck_length - EDGE_GAP, n)
+        zs = rng.uniform(z_min, z_max, n)
 
-        for _ in range(15):
+        for x, z in zip(xs.tolist(), zs.tolist()):
+            elements.append(_create_dot(x + ox, y + oy, z + oz))
+
+        n = _count(15, density)
+        xs = rng.uniform(EDGE_GAP, deck_length - EDGE_GAP - TRI_SIZE_MAX, n)
+        zs = rng.uniform(z_min, z_max, n)
+        picks = rng.integers(TRI_TEMPLATE_COUNT, size=n)
+
+        for x, z, k in zip(xs.tolist(), zs.tolist(), picks.tolist()):
             elements.append(
                 _create_triangle(
-                    random.uniform(
-                        EDGE_GAP,
-                        deck_length - EDGE_GAP - TRI_SIZE_MAX
-                    ),
-                    y,
-                    random.uniform(z_min, z_max),
-                    rot_y,
-                    math.pi / 2
+                    x + ox, y + oy, z + oz, side_triangles[k],
+                    _ROT_AX_X, _HALF_PI
                 )
             )
 
     # LEFT & RIGHT (X faces)
-    rot_x = gp_Ax1(gp_Pnt(0, 0, 0), gp_Dir(0, 1, 0))
-
     for x in (0.2, deck_length - 0.2):
-        for _ in range(100):
-            elements.append(
-                _create_dot(
-                    x,
-                    random.uniform(EDGE_GAP, deck_width - EDGE_GAP),
-                    random.uniform(z_min, z_max)
-                )
-            )
+        n = _count(100, density)
+        ys = rng.uniform(EDGE_GAP, deck_width - EDGE_GAP, n)
+        zs = rng.uniform(z_min, z_max, n)
+
+        for y, z in zip(ys.tolist(), zs.tolist()):
+            elements.append(_create_dot(x + ox, y + oy, z + oz))
 
-        for _ in range(20):
+        n = _count(20, density)
+        ys = rng.uniform(EDGE_GAP, deck_width - EDGE_GAP - TRI_SIZE_MAX, n)
+        zs = rng.uniform(z_min, z_max, n)
+        picks = rng.integers(TRI_TEMPLATE_COUNT, size=n)
+
+        for y, z, k in zip(ys.tolist(), zs.tolist(), picks.tolist()):
             elements.append(
                 _create_triangle(
-                    x,
-                    random.uniform(
-                        EDGE_GAP,
-                        deck_width - EDGE_GAP - TRI_SIZE_MAX
-                    ),
-                    random.uniform(z_min, z_max),
-                    rot_x,
-                    -math.pi / 2
+                    x + ox, y + oy, z + oz, side_triangles[k],
+                    _ROT_AX_Y, -_HALF_PI
                 )
             )
 
@@ -172,70 +207,47 @@ def generate_deck_texture(
         (deck_thickness - 0.2, True),   # TOP
         (0.2, False)                   # BOTTOM
     ):
-        for _ in range(150):
-            elements.append(
-                _create_dot_z(
-                    random.uniform(EDGE_GAP, deck_length - EDGE_GAP),
-                    random.uniform(EDGE_GAP, deck_width - EDGE_GAP),
-                    z,
-                    up=up
-                )
-            )
-
-        for _ in range(50):
+        n = _count(150, density)
+        xs = rng.uniform(EDGE_GAP, deck_length - EDGE_GAP, n)
+        ys = rng.uniform(EDGE_GAP, deck_width - EDGE_GAP, n)
+
+        for x, y in zip(xs.tolist(), ys.tolist()):
+            elements.append(_create_dot_z(x + ox, y + oy, z + oz, up=up))
+
+        n = _count(50, density)
+        xs = rng.uniform(EDGE_GAP, deck_length - EDGE_GAP - TRI_SIZE_MAX, n)
+        ys = rng.uniform(EDGE_GAP, deck_width - EDGE_GAP - TRI_SIZE_MAX, n)
+        picks = rng.integers(TRI_TEMPLATE_COUNT, size=n)
+        flat_triangles = _triangle_templates(
+            TRI_HEIGHT if up else -TRI_HEIGHT, 0.0
+        )
+
+        for x, y, k in zip(xs.tolist(), ys.tolist(), picks.tolist()):
             elements.append(
-                _create_triangle_xy(
-                    random.uniform(
-                        EDGE_GAP,
-                        deck_length - EDGE_GAP - TRI_SIZE_MAX
-                    ),
-                    random.uniform(
-                        EDGE_GAP,
-                        deck_width - EDGE_GAP - TRI_SIZE_MAX
-                    ),
-                    z,
-                    up=up
-                )
+                _create_triangle_xy(x + ox, y + oy, z + oz, flat_triangles[k])
             )
 
     return elements
 
 
-# Centering helper
-def shift_texture_to_center(texture_shapes, deck_width):
-    trsf = gp_Trsf()
-    trsf.SetTranslation(gp_Vec(0, -deck_width / 2, 0))
-
-    return [
-        BRepBuilderAPI_Transform(s, trsf, True).Shape()
-        for s in texture_shapes
-    ]
-
-
 # Placement helper
 def place_deck_texture(
     deck_length,
     deck_width,
     deck_thickness,
-    deck_top_z
+    deck_top_z,
+    density=1.0,
+    seed=None
 ):
     texture_shapes = generate_deck_texture(
         deck_length=deck_length,
         deck_width=deck_width,
-        deck_thickness=deck_thickness
-    )
-
-    texture_shapes = shift_texture_to_center(
-        texture_shapes,
-        deck_width=deck_width
-    )
-
-    trsf = gp_Trsf()
-    trsf.SetTranslation(
-        gp_Vec(0, 0, deck_top_z - deck_thickness)
+        deck_thickness=deck_thickness,
+        density=density,
+        seed=seed,
+        # Centered on Y=0, lifted onto the deck: applied while
+        # generating, so there is no per-element placement pass
+        origin=(0.0, -deck_width / 2, deck_top_z - deck_thickness)
     )
 
-    return [
-        BRepBuilderAPI_Transform(s, trsf, True).Shape()
-        for s in texture_shapes
-    ]
+    return texture_shapes
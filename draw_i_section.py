@@ -1,16 +1,21 @@
-from OCC.Core.gp import gp_Vec, gp_Trsf
-from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-from OCC.Display.SimpleGui import init_display
-from OCC.Display.backend import load_backend
-load_backend("pyside6")
+from functools import lru_cache
 
+from OCC.Core.gp import gp_Pnt, gp_Vec
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakePrism
+from OCC.Core.BRepBuilderAPI import (
+    BRepBuilderAPI_MakePolygon,
+    BRepBuilderAPI_MakeFace
+)
 
+
+@lru_cache(maxsize=16)
 def create_i_section(length, width, depth, flange_thickness, web_thickness):
     """
     Create an I-section CAD model with the specified dimensions.
 
+    The I-shaped profile is drawn once in the YZ plane and extruded
+    along +X (no boolean fuse of flanges and web).
+
     Parameters:
     - length: Length of the I-section
     - width: Width of the I-section (horizontal dimension)
@@ -20,28 +25,46 @@ def create_i_section(length, width, depth, flange_thickness, web_thickness):
 
     Returns:
     - i_section_solid: The I-section CAD model as a TopoDS_Solid
+
+    Results are cached per dimension set; treat the returned shape as a
+    shared template and place it with a transform instead of modifying it.
     """
-    # Dimensions for the I-section
-    web_height = depth - 2 * flange_thickness
+    # Web faces (web centered between flange edges)
+    y_web_left = (width - web_thickness) / 2
+    y_web_right = (width + web_thickness) / 2
+
+    # Flange inner faces
+    z_bottom_inner = flange_thickness
+    z_top_inner = depth - flange_thickness
 
-    # Create the bottom flange
-    bottom_flange = BRepPrimAPI_MakeBox(length, width, flange_thickness).Shape()
+    # Profile points (YZ plane), going around the I outline
+    profile = (
+        (0, 0),                          # bottom flange
+        (width, 0),
+        (width, z_bottom_inner),
+        (y_web_right, z_bottom_inner),   # web right face
+        (y_web_right, z_top_inner),
+        (width, z_top_inner),            # top flange
+        (width, depth),
+        (0, depth),
+        (0, z_top_inner),
+        (y_web_left, z_top_inner),       # web left face
+        (y_web_left, z_bottom_inner),
+        (0, z_bottom_inner),
+    )
 
-    # Create the top flange
-    top_flange = BRepPrimAPI_MakeBox(length, width, flange_thickness).Shape()
-    trsf = gp_Trsf()
-    trsf.SetTranslation(gp_Vec(0, 0, depth - flange_thickness))  # Move to the top
-    top_flange_transform = BRepBuilderAPI_Transform(top_flange, trsf, True).Shape()
+    poly = BRepBuilderAPI_MakePolygon()
+    for y, z in profile:
+        poly.Add(gp_Pnt(0, y, z))
+    poly.Close()
 
-    # Create the web
-    web = BRepPrimAPI_MakeBox(length, web_thickness, web_height).Shape()
-    trsf = gp_Trsf()
-    trsf.SetTranslation(gp_Vec(0, (width - web_thickness) / 2, flange_thickness))  # Centered between flanges
-    web_transform = BRepBuilderAPI_Transform(web, trsf, True).Shape()
+    face = BRepBuilderAPI_MakeFace(poly.Wire()).Face()
 
-    # Combine the flanges and web to form the I-section
-    i_section_solid = BRepAlgoAPI_Fuse(bottom_flange, top_flange_transform).Shape()
-    i_section_solid = BRepAlgoAPI_Fuse(i_section_solid, web_transform).Shape()
+    # Extrude along X
+    i_section_solid = BRepPrimAPI_MakePrism(
+        face,
+        gp_Vec(length, 0, 0)
+    ).Shape()
 
     return i_section_solid
 
@@ -56,6 +79,9 @@ def create_i_section(length, width, depth, flange_thickness, web_thickness):
 #     i_section = create_i_section(length, width, height, flange_thickness, web_thickness)
 
 #     # Visualization
+#     from OCC.Display.backend import load_backend
+#     load_backend("pyside6")
+#     from OCC.Display.SimpleGui import init_display
 #     display, start_display, add_menu, add_function_to_menu = init_display()
 
 #     # Show the I-section model
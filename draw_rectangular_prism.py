@@ -1,6 +1,5 @@
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
-from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.gp import gp_Pnt
 
 def create_rectangular_prism(length, breadth, height):
     """
@@ -9,11 +8,10 @@ def create_rectangular_prism(length, breadth, height):
     Z: 0 → height
     """
 
-    box = BRepPrimAPI_MakeBox(length, breadth, height).Shape()
-
-    trsf = gp_Trsf()
-    trsf.SetTranslation(
-        gp_Vec(-length/2, -breadth/2, 0)
-    )
-
-    return BRepBuilderAPI_Transform(box, trsf, True).Shape()
+    # Box built directly at its final corner (no transform pass)
+    return BRepPrimAPI_MakeBox(
+        gp_Pnt(-length/2, -breadth/2, 0),
+        length,
+        breadth,
+        height
+    ).Shape()
@@ -0,0 +1,98 @@
+# layout.py
+# Pure numeric layout kernels (no OCC calls).
+# Compiled with numba when it is installed, plain Python/NumPy otherwise.
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    def njit(*args, **kwargs):
+        """Fallback: numba is optional, run kernels uncompiled"""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+@njit(cache=True)
+def girder_offsets(num_girders, girder_spacing):
+    """
+    Y position (flange left edge) of every girder,
+    laid out symmetrically about the centerline.
+    """
+    total_width = (num_girders - 1) * girder_spacing
+    return np.arange(num_girders) * girder_spacing - total_width / 2
+
+
+@njit(cache=True)
+def bracing_layout(span_length, bracing_spacing, num_girders, girder_spacing):
+    """
+    Cross bracing frame layout.
+
+    Returns:
+    --------
+    x_positions : X of every bracing frame (both span ends included)
+    y_left, y_right : Y of the left / right girder of every bay
+    """
+    n_total = int(span_length / bracing_spacing) + 1
+    x_positions = np.linspace(0.0, span_length, n_total)
+
+    y_girders = girder_offsets(num_girders, girder_spacing)
+
+    return x_positions, y_girders[:-1], y_girders[1:]
+
+
+@njit(cache=True)
+def deck_width(
+    carriageway_width,
+    barrier_base_width,
+    footpath_sides,
+    footpath_width,
+    railing_width
+):
+    """
+    carriageway + 2 × barrier base + n × (footpath + railing)
+    """
+    return (
+        carriageway_width
+        + 2 * barrier_base_width
+        + footpath_sides * (footpath_width + railing_width)
+    )
+
+
+@njit(cache=True)
+def barrier_offsets(
+    deck_width,
+    carriageway_offset,
+    carriageway_width,
+    barrier_base_width
+):
+    """
+    Candidate crash barrier center Y positions.
+
+    Returns:
+    --------
+    (left_at_deck_edge, left_at_carriageway_edge,
+     right_at_deck_edge, right_at_carriageway_edge)
+    """
+    deck_half_width = deck_width / 2
+    carriageway_half_width = carriageway_width / 2
+    half_base = barrier_base_width / 2
+
+    return (
+        -deck_half_width + half_base,
+        carriageway_offset - carriageway_half_width - half_base,
+        deck_half_width - half_base,
+        carriageway_offset + carriageway_half_width + half_base,
+    )
+
+
+@njit(cache=True)
+def railing_hole_z(rail_count, base_height, body_height, hole_height):
+    """
+    Bottom Z of every railing hole: hole centers equally spaced
+    over the railing body (above the base).
+    """
+    spacing = body_height / (rail_count + 1)
+    z_centers = base_height + np.arange(1, rail_count + 1) * spacing
+    return z_centers - hole_height / 2
@@ -1,31 +1,87 @@
 # Railing with internal rectangular holes
 
+from functools import lru_cache
+
 from draw_rectangular_prism import create_rectangular_prism
+from boolean_ops import cut_shapes, fuse_shapes, compound_shapes
+from layout import railing_hole_z
 
-from OCC.Core.gp import gp_Vec, gp_Trsf
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Cut, BRepAlgoAPI_Fuse
+from OCC.Core.gp import gp_Pnt, gp_Vec, gp_Trsf
+from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 # Utility
 def translate(shape, x=0, y=0, z=0):
+    """Located copy of shape (shares its BRep, no builder pass)"""
+    if x == 0 and y == 0 and z == 0:
+        return shape
+
     trsf = gp_Trsf()
     trsf.SetTranslation(gp_Vec(x, y, z))
-    return BRepBuilderAPI_Transform(shape, trsf, True).Shape()
+    return shape.Moved(TopLoc_Location(trsf))
+
+
+def _box_between(x0, x1, y0, y1, z0, z1):
+    """Axis-aligned box between two corners, None if it is empty"""
+    if x1 - x0 <= 1e-9 or y1 - y0 <= 1e-9 or z1 - z0 <= 1e-9:
+        return None
+    return BRepPrimAPI_MakeBox(gp_Pnt(x0, y0, z0), x1 - x0, y1 - y0, z1 - z0).Shape()
+
+
+def _railing_from_boxes(length, width, height, base_height, hole_xy, hole_size, hole_zs):
+    """
+    Railing with holes as boxes only: base + full-width strips between
+    the holes + the walls around each hole.
+    """
+    hole_x, hole_y = hole_xy
+    hole_length, hole_width, hole_height = hole_size
+
+    x0, x1 = -length / 2, length / 2
+    y0, y1 = -width / 2, width / 2
+    hx0, hx1 = hole_x - hole_length / 2, hole_x + hole_length / 2
+    hy0, hy1 = hole_y - hole_width / 2, hole_y + hole_width / 2
+
+    boxes = [_box_between(x0, x1, y0, y1, 0, base_height)]
+
+    z = base_height
+    for hz0 in hole_zs:
+        hz1 = hz0 + hole_height
+
+        # Solid strip below the hole, then the walls around it
+        boxes += [
+            _box_between(x0, x1, y0, y1, z, hz0),
+            _box_between(x0, x1, y0, hy0, hz0, hz1),
+            _box_between(x0, x1, hy1, y1, hz0, hz1),
+            _box_between(x0, hx0, hy0, hy1, hz0, hz1),
+            _box_between(hx1, x1, hy0, hy1, hz0, hz1),
+        ]
+        z = hz1
+
+    boxes.append(_box_between(x0, x1, y0, y1, z, height))
+
+    return compound_shapes(*(box for box in boxes if box is not None))
 
 
 # Railing geometry
+@lru_cache(maxsize=16)
 def create_railing(
     length,
     width,
     height,
-    rail_count
+    rail_count,
+    preview=False
 ):
     """
     Railing composed of:
     - Solid base (fixed 100 mm)
     - Upper railing body
     - Rectangular holes inside body at equal vertical spacing
+
+    preview=True builds the same outline as a compound of boxes around
+    the holes (no Cut / Fuse), for display only.
+
+    Cached per parameter set; place the result with place_railing().
     """
 
     # Fixed base height
@@ -60,46 +116,49 @@ def create_railing(
     hole_width  = HOLE_WIDTH_RATIO  * width
     hole_height = HOLE_HEIGHT_RATIO * (body_height / rail_count)
 
-    # Equal vertical spacing
-    spacing = body_height / (rail_count + 1)
-
-    body_with_holes = body
-
-    # 4. Create & cut holes
-    for i in range(rail_count):
-
-        z_center = BASE_HEIGHT + (i + 1) * spacing
-
-        HOLE_Y_OFFSET_RATIO = -0.2
+    HOLE_Y_OFFSET_RATIO = -0.2
 
-        y_offset = HOLE_Y_OFFSET_RATIO * width
+    y_offset = HOLE_Y_OFFSET_RATIO * width
 
+    # Hole offsets: centered in X, shifted in Y,
+    # centered on equally spaced Z (compiled layout kernel)
+    hole_x = (length - hole_length) / 2
+    hole_y = (width  - hole_width)  / 2 + y_offset
+    hole_zs = railing_hole_z(
+        rail_count, BASE_HEIGHT, body_height, hole_height
+    ).tolist()
 
-
-
-        hole = create_rectangular_prism(
-            hole_length,
-            hole_width,
-            hole_height
+    if preview:
+        return _railing_from_boxes(
+            length, width, height, BASE_HEIGHT,
+            (hole_x, hole_y),
+            (hole_length, hole_width, hole_height),
+            hole_zs
         )
 
-        hole = translate(
-            hole,
-            x=(length - hole_length) / 2,   # center in X
-            y=(width  - hole_width)  / 2 + y_offset,   
-            z=z_center - hole_height / 2    # center in Z
-        )
+    # 4. Create holes (collected, cut once below)
+    # One prism; every hole is a located copy of it
+    base_hole = create_rectangular_prism(
+        hole_length,
+        hole_width,
+        hole_height
+    )
+
+    holes = [
+        translate(base_hole, x=hole_x, y=hole_y, z=z)
+        for z in hole_zs
+    ]
 
-        body_with_holes = BRepAlgoAPI_Cut(
-            body_with_holes,
-            hole
-        ).Shape()
+    # One Cut with all holes as tools instead of one per hole.
+    # Non-destructive: the holes are located copies sharing one
+    # base_hole TShape, and the cut result may share sub-shapes with them.
+    body_with_holes = cut_shapes(body, *holes)
 
-    # 5. Fuse base + body
-    railing = BRepAlgoAPI_Fuse(
+    # 5. Fuse base + body (non-destructive, same reason)
+    railing = fuse_shapes(
         base,
         body_with_holes
-    ).Shape()
+    )
 
     return railing
 
@@ -1,12 +1,15 @@
 # sections/angle_section.py
 
+from functools import lru_cache
+
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
-from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.gp import gp_Pnt
+
+from boolean_ops import join_shapes
 
 
-def create_angle_section(length, leg_h, leg_w, thickness):
+@lru_cache(maxsize=64)
+def create_angle_section(length, leg_h, leg_w, thickness, fuse=False):
     """
     Angle section with bounding-box centered at origin.
     Length along +X.
@@ -14,11 +17,22 @@ def create_angle_section(length, leg_h, leg_w, thickness):
 NOTE:
 - This is NOT centroid-centered
 - Centroid handling must be done at analysis level (OS-DAG)
+
+fuse=False returns the two legs as a compound (no boolean);
+pass fuse=True when a single fused solid is required.
+
+Cached per dimension set: treat the result as a shared template and
+place it with a transform instead of modifying it.
 """
 
 
+    # Legs are built directly at their centered position
+    # (bounding box: length × leg_w × leg_h), no recentering pass
+    corner = gp_Pnt(-length / 2, -leg_w / 2, -leg_h / 2)
+
     # Vertical leg
     leg1 = BRepPrimAPI_MakeBox(
+        corner,
         length,
         thickness,
         leg_h
@@ -26,24 +40,11 @@ NOTE:
 
     # Horizontal leg
     leg2 = BRepPrimAPI_MakeBox(
+        corner,
         length,
         leg_w,
         thickness
     ).Shape()
 
-    angle = BRepAlgoAPI_Fuse(leg1, leg2).Shape()
-
-
-    # Box was centered at (-t/2, -t/2)
-    # Angle bounding box is (leg_w, leg_h)
-
-    trsf = gp_Trsf()
-    trsf.SetTranslation(
-        gp_Vec(
-            -length / 2,
-            -leg_w / 2,
-            -leg_h / 2
-        )
-    )
-
-    return BRepBuilderAPI_Transform(angle, trsf, True).Shape()
+    # Fresh boxes: a fuse may modify them in place
+    return join_shapes(leg1, leg2, fuse=fuse, destructive=True)
@@ -1,12 +1,22 @@
 # sections/channel_section.py
 
+from functools import lru_cache
+
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
-from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.gp import gp_Pnt
+
+from boolean_ops import join_shapes
 
 
-def create_channel_section(length, depth, flange_width, web_thickness, flange_thickness):
+@lru_cache(maxsize=64)
+def create_channel_section(
+    length,
+    depth,
+    flange_width,
+    web_thickness,
+    flange_thickness,
+    fuse=False
+):
     """
     Channel (C) section with bounding-box centered at origin.
 
@@ -18,12 +28,26 @@ def create_channel_section(length, depth, flange_width, web_thickness, flange_th
     NOTE:
     - Geometry is NOT centroid-centered
     - Centroid handling belongs to analysis / OS-DAG layer
+
+    fuse=False returns web + flanges as a compound (no boolean);
+    pass fuse=True when a single fused solid is required.
+
+    Cached per dimension set: treat the result as a shared template and
+    place it with a transform instead of modifying it.
     """
 
 
+    # Boxes are built directly at their centered position
+    # (bounding box: length × flange_width × depth), no recentering pass
+    x0 = -length / 2
+    y0 = -flange_width / 2
+    z0 = -depth / 2
+
+
     # 1. Web (vertical plate)
 
     web = BRepPrimAPI_MakeBox(
+        gp_Pnt(x0, y0, z0),
         length,
         web_thickness,
         depth
@@ -33,65 +57,26 @@ def create_channel_section(length, depth, flange_width, web_thickness, flange_th
     # 2. Bottom flange
 
     bottom_flange = BRepPrimAPI_MakeBox(
+        gp_Pnt(x0, y0, z0),
         length,
         flange_width,
         flange_thickness
     ).Shape()
 
-    trsf_bottom = gp_Trsf()
-    trsf_bottom.SetTranslation(
-        gp_Vec(
-            0,
-            0,
-            0
-        )
-    )
-    bottom_flange = BRepBuilderAPI_Transform(
-        bottom_flange, trsf_bottom, True
-    ).Shape()
-
 
     # 3. Top flange
 
     top_flange = BRepPrimAPI_MakeBox(
+        gp_Pnt(x0, y0, z0 + depth - flange_thickness),
         length,
         flange_width,
         flange_thickness
     ).Shape()
 
-    trsf_top = gp_Trsf()
-    trsf_top.SetTranslation(
-        gp_Vec(
-            0,
-            0,
-            depth - flange_thickness
-        )
-    )
-    top_flange = BRepBuilderAPI_Transform(
-        top_flange, trsf_top, True
-    ).Shape()
-
 
-    # 4. Fuse all parts
+    # 4. Join all parts (fresh boxes: a fuse may modify them in place)
   
-    channel = BRepAlgoAPI_Fuse(web, bottom_flange).Shape()
-    channel = BRepAlgoAPI_Fuse(channel, top_flange).Shape()
-
-
-
-    # Bounding box:
-    #   Y: flange_width
-    #   Z: depth
-
-    trsf_center = gp_Trsf()
-    trsf_center.SetTranslation(
-        gp_Vec(
-            -length / 2,
-            -flange_width / 2,
-            -depth / 2
-        )
+    return join_shapes(
+        web, bottom_flange, top_flange,
+        fuse=fuse, destructive=True
     )
-
-    return BRepBuilderAPI_Transform(
-        channel, trsf_center, True
-    ).Shape()
@@ -1,18 +1,22 @@
 # sections/double_angle_section.py
 
-from OCC.Core.gp import gp_Trsf, gp_Vec, gp_Ax2, gp_Pnt, gp_Dir
+from functools import lru_cache
+
+from OCC.Core.gp import gp_Trsf, gp_Vec
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
 
+from boolean_ops import join_shapes
 from sections.angle_section import create_angle_section
 
 
+@lru_cache(maxsize=64)
 def create_double_angle_section(
     length,
     leg_h,
     leg_w,
     thickness,
-    connection_type="LONGER_LEG"
+    connection_type="LONGER_LEG",
+    fuse=False
 ):
     """
     Double angle (⅃L) section.
@@ -26,14 +30,12 @@ def create_double_angle_section(
     connection_type:
     - LONGER_LEG  : longer legs connected back-to-back
     - SHORTER_LEG : shorter legs connected back-to-back
-    """
 
-    base = create_angle_section(length, leg_h, leg_w, thickness)
+    fuse=False returns both angles as a compound (no boolean).
+    Cached per parameter set, like create_angle_section().
+    """
 
-    # Mirror to form ⅃
-    mirror = gp_Trsf()
-    mirror.SetMirror(gp_Ax2(gp_Pnt(0, 0, 0), gp_Dir(0, 1, 0)))
-    mirrored = BRepBuilderAPI_Transform(base, mirror, True).Shape()
+    base = create_angle_section(length, leg_h, leg_w, thickness, fuse=fuse)
 
     # Decide spacing
     if connection_type == "LONGER_LEG":
@@ -47,10 +49,16 @@ def create_double_angle_section(
     trsf_pos = gp_Trsf()
     trsf_pos.SetTranslation(gp_Vec(0, +offset, 0))
 
+    # Mirror to form ⅃ and move it in a single transform pass
+    # (x, y, z) -> (x, -y - offset, z), written as one matrix
     trsf_neg = gp_Trsf()
-    trsf_neg.SetTranslation(gp_Vec(0, -offset, 0))
+    trsf_neg.SetValues(
+        1,  0, 0, 0,
+        0, -1, 0, -offset,
+        0,  0, 1, 0
+    )
 
-    a1 = BRepBuilderAPI_Transform(base, trsf_pos, True).Shape()
-    a2 = BRepBuilderAPI_Transform(mirrored, trsf_neg, True).Shape()
+    a1 = BRepBuilderAPI_Transform(base, trsf_pos, False).Shape()
+    a2 = BRepBuilderAPI_Transform(base, trsf_neg, True).Shape()
 
-    return BRepAlgoAPI_Fuse(a1, a2).Shape()
+    return join_shapes(a1, a2, fuse=fuse)
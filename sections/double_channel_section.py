@@ -10,19 +10,23 @@ Resulting shape: ][
 - Centroid lies on Y = 0 plane
 """
 
-from OCC.Core.gp import gp_Trsf, gp_Ax2, gp_Pnt, gp_Dir, gp_Vec
+from functools import lru_cache
+
+from OCC.Core.gp import gp_Trsf, gp_Vec
 from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
-from OCC.Core.BRepAlgoAPI import BRepAlgoAPI_Fuse
 
+from boolean_ops import join_shapes
 from sections.channel_section import create_channel_section
 
 
+@lru_cache(maxsize=64)
 def create_double_channel_section(
     length,
     depth,
     flange_width,
     web_thickness,
-    flange_thickness
+    flange_thickness,
+    fuse=False
 ):
     """
     Double channel (][) section.
@@ -36,6 +40,9 @@ def create_double_channel_section(
     NOTE:
     - Geometry is bounding-box centered
     - NOT centroid-centered
+
+    fuse=False returns both channels as a compound (no boolean).
+    Cached per parameter set, like create_channel_section().
     """
 
     base = create_channel_section(
@@ -43,24 +50,26 @@ def create_double_channel_section(
         depth=depth,
         flange_width=flange_width,
         web_thickness=web_thickness,
-        flange_thickness=flange_thickness
+        flange_thickness=flange_thickness,
+        fuse=fuse
     )
 
-    # Mirror one channel
-    mirror = gp_Trsf()
-    mirror.SetMirror(gp_Ax2(gp_Pnt(0, 0, 0), gp_Dir(0, 1, 0)))
-    mirrored = BRepBuilderAPI_Transform(base, mirror, True).Shape()
-
     # Move channels so webs meet at Y = 0
     offset = flange_width / 2
 
     trsf_pos = gp_Trsf()
     trsf_pos.SetTranslation(gp_Vec(0, +offset, 0))
 
+    # Mirror one channel and move it in a single transform pass
+    # (x, y, z) -> (x, -y - offset, z), written as one matrix
     trsf_neg = gp_Trsf()
-    trsf_neg.SetTranslation(gp_Vec(0, -offset, 0))
+    trsf_neg.SetValues(
+        1,  0, 0, 0,
+        0, -1, 0, -offset,
+        0,  0, 1, 0
+    )
 
-    c1 = BRepBuilderAPI_Transform(base, trsf_pos, True).Shape()
-    c2 = BRepBuilderAPI_Transform(mirrored, trsf_neg, True).Shape()
+    c1 = BRepBuilderAPI_Transform(base, trsf_pos, False).Shape()
+    c2 = BRepBuilderAPI_Transform(base, trsf_neg, True).Shape()
 
-    return BRepAlgoAPI_Fuse(c1, c2).Shape()
+    return join_shapes(c1, c2, fuse=fuse)
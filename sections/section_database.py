@@ -1,3 +1,6 @@
+from functools import lru_cache
+from types import MappingProxyType
+
 
 ISA_SECTIONS = {
     "ISA_100x100x8": {
@@ -47,9 +50,11 @@ SECTION_DATABASE = {
 }
 
 
+@lru_cache(maxsize=None)
 def get_section_props(section_type, designation):
     """
-    Returns section properties dict based on section type and designation.
+    Returns section properties based on section type and designation.
+    The result is a cached, read-only mapping shared by all callers.
     """
     if section_type not in SECTION_DATABASE:
         raise ValueError(
@@ -65,7 +70,7 @@ def get_section_props(section_type, designation):
             f"Available: {list(db.keys())}"
         )
 
-    return db[designation]
+    return MappingProxyType(db[designation])
 
 
 SECTION_ROLL_RULES = {
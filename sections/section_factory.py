@@ -1,3 +1,5 @@
+from functools import lru_cache
+
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
 
 from .angle_section import create_angle_section
@@ -14,53 +16,73 @@ def create_section_solid(
 ):
     """
     Factory for section solids aligned along +X axis.
-    """
 
-    if section_type == "BOX":
-        return BRepPrimAPI_MakeBox(
-            length,
-            thickness,
-            thickness
-        ).Shape()
-
-    elif section_type == "ANGLE":
-        return create_angle_section(
-            length=length,
-            leg_h=section_props["leg_h"],
-            leg_w=section_props["leg_w"],
-            thickness=section_props["thickness"]
-        )
+    Cached per (section type, length, thickness, props): members with
+    the same spec share one solid. Treat the result as a template and
+    place it with a transform instead of modifying it.
+    """
+    props_key = tuple(sorted(section_props.items())) if section_props else None
 
-    elif section_type == "DOUBLE_ANGLE":
-        return create_double_angle_section(
-            length=length,
-            leg_h=section_props["leg_h"],
-            leg_w=section_props["leg_w"],
-            thickness=section_props["thickness"],
-            connection_type=section_props.get(
-                "connection_type", "LONGER_LEG"
-            )
+    # Length is rounded so float jitter still hits the cache
+    return _create_section_solid(
+        section_type,
+        round(length, 6),
+        thickness,
+        props_key
     )
 
 
+def _create_box_section(length, thickness, section_props):
+    return BRepPrimAPI_MakeBox(
+        length,
+        thickness,
+        thickness
+    ).Shape()
 
-    elif section_type == "CHANNEL":
-        return create_channel_section(
-            length=length,
-            depth=section_props["depth"],
-            flange_width=section_props["flange_width"],
-            web_thickness=section_props["web_thickness"],
-            flange_thickness=section_props["flange_thickness"]
-        )
-    
-    elif section_type == "DOUBLE_CHANNEL":                    
-        return create_double_channel_section(
-            length=length,
-            depth=section_props["depth"],
-            flange_width=section_props["flange_width"],
-            web_thickness=section_props["web_thickness"],
-            flange_thickness=section_props["flange_thickness"]
+
+def _props_builder(builder, required, optional=()):
+    """
+    Adapts a section builder to the factory signature: required props
+    are passed as keyword arguments, optional ones only when present.
+    """
+    def build(length, thickness, section_props):
+        kwargs = {key: section_props[key] for key in required}
+        kwargs.update(
+            (key, section_props[key])
+            for key in optional
+            if key in section_props
         )
+        return builder(length=length, **kwargs)
 
-    else:
+    return build
+
+
+_ANGLE_PROPS = ("leg_h", "leg_w", "thickness")
+_CHANNEL_PROPS = ("depth", "flange_width", "web_thickness", "flange_thickness")
+
+# section_type -> builder(length, thickness, section_props)
+_SECTION_BUILDERS = {
+    "BOX": _create_box_section,
+    "ANGLE": _props_builder(create_angle_section, _ANGLE_PROPS),
+    "DOUBLE_ANGLE": _props_builder(
+        create_double_angle_section,
+        _ANGLE_PROPS,
+        optional=("connection_type",)
+    ),
+    "CHANNEL": _props_builder(create_channel_section, _CHANNEL_PROPS),
+    "DOUBLE_CHANNEL": _props_builder(
+        create_double_channel_section,
+        _CHANNEL_PROPS
+    ),
+}
+
+
+@lru_cache(maxsize=256)
+def _create_section_solid(section_type, length, thickness, props_key):
+    section_props = dict(props_key) if props_key is not None else None
+
+    build = _SECTION_BUILDERS.get(section_type)
+    if build is None:
         raise ValueError(f"Unsupported section type: {section_type}")
+
+    return build(length, thickness, section_props)
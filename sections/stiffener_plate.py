@@ -1,14 +1,20 @@
+from functools import lru_cache
+
 from OCC.Core.BRepPrimAPI import BRepPrimAPI_MakeBox
 from OCC.Core.gp import gp_Trsf, gp_Vec
-from OCC.Core.BRepBuilderAPI import BRepBuilderAPI_Transform
+from OCC.Core.TopLoc import TopLoc_Location
 
 
 def _translate(shape, dx=0, dy=0, dz=0):
+    if dx == 0 and dy == 0 and dz == 0:
+        return shape
+
     trsf = gp_Trsf()
     trsf.SetTranslation(gp_Vec(dx, dy, dz))
-    return BRepBuilderAPI_Transform(shape, trsf, True).Shape()
+    return shape.Moved(TopLoc_Location(trsf))
 
 
+@lru_cache(maxsize=16)
 def create_girder_stiffeners(
     *,
     girder_depth,
@@ -22,6 +28,7 @@ def create_girder_stiffeners(
     """
     Create rectangular web stiffeners for I-girder.
     Placement is EXACTLY consistent with create_i_section().
+    Cached: returned plates are shared templates, do not modify them.
     """
 
     # 1. Height between flanges
@@ -0,0 +1,32 @@
+import unittest
+
+from validation import validate_bridge_inputs
+
+
+VALID = dict(
+    num_girders=4,
+    girder_spacing=2000,
+    span_length=30000,
+    cross_bracing_spacing=5000
+)
+
+
+class DeckThicknessTest(unittest.TestCase):
+
+    def test_not_given_is_valid(self):
+        validate_bridge_inputs(**VALID)
+
+    def test_in_range_is_valid(self):
+        validate_bridge_inputs(**VALID, deck_thickness=200)
+
+    def test_negative_raises(self):
+        with self.assertRaises(ValueError):
+            validate_bridge_inputs(**VALID, deck_thickness=-50)
+
+    def test_zero_raises(self):
+        with self.assertRaises(ValueError):
+            validate_bridge_inputs(**VALID, deck_thickness=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
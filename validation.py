@@ -1,56 +1,79 @@
 # validation.py
 
-def validate_bridge_inputs(
+from layout import njit
+
+
+# Error codes returned by _check_bridge_inputs (0 = valid)
+ERR_NUM_GIRDERS = 1
+ERR_GIRDER_SPACING = 2
+ERR_SPAN_LENGTH = 3
+ERR_BRACING_SPACING_MIN = 4
+ERR_BRACING_SPACING_SPAN = 5
+ERR_CARRIAGEWAY_WIDTH = 6
+ERR_DECK_THICKNESS = 7
+
+# ERR_* code -> ValueError message (formatted with the offending values)
+_ERROR_MESSAGES = {
+    ERR_NUM_GIRDERS:
+        "Number of girders must be greater than 2 and less than 12.",
+    ERR_GIRDER_SPACING:
+        "Girder spacing must be greater than 1 m and less than 24 m.",
+    ERR_SPAN_LENGTH:
+        "Span length must be greater than 20 m and less than 45 m.",
+    ERR_BRACING_SPACING_MIN:
+        "Cross bracing spacing must be greater than 1 m.",
+    ERR_BRACING_SPACING_SPAN:
+        "Cross bracing spacing must be less than span length.",
+    ERR_CARRIAGEWAY_WIDTH:
+        "Carriageway width {carriageway_width} mm is invalid. "
+        "Allowed range: 4250 mm < width < 24000 mm.",
+    ERR_DECK_THICKNESS:
+        "Deck thickness {deck_thickness} mm is invalid. "
+        "Allowed range: 100 mm < thickness < 500 mm.",
+}
+
+
+@njit(cache=True)
+def _check_bridge_inputs(
     num_girders,
     girder_spacing,
     span_length,
     cross_bracing_spacing,
-    deck_thickness=None,
-    footpath_config=None,
-    footpath_width=None
+    has_deck_thickness,
+    deck_thickness
 ):
     """
-    Validates bridge input parameters based on design constraints
-    and cross-section guidelines (as per given figure).
-    All dimensions are in millimetres.
+    Numeric core of validate_bridge_inputs (compiled).
+    Returns 0 if valid, else the ERR_* code of the first failed check.
+    deck_thickness is only checked when has_deck_thickness is True.
     """
 
     # -------------------------------------------------
     # 1. Number of girders
     # -------------------------------------------------
     if num_girders <= 2 or num_girders >= 12:
-        raise ValueError(
-            "Number of girders must be greater than 2 and less than 12."
-        )
+        return ERR_NUM_GIRDERS
 
     # -------------------------------------------------
     # 2. Girder spacing (1 m < spacing < 24 m)
     # -------------------------------------------------
     if girder_spacing <= 1000 or girder_spacing >= 24000:
-        raise ValueError(
-            "Girder spacing must be greater than 1 m and less than 24 m."
-        )
+        return ERR_GIRDER_SPACING
 
     # -------------------------------------------------
     # 3. Span length (20 m < span < 45 m)
     # -------------------------------------------------
     if span_length <= 20000 or span_length >= 45000:
-        raise ValueError(
-            "Span length must be greater than 20 m and less than 45 m."
-        )
+        return ERR_SPAN_LENGTH
 
     # -------------------------------------------------
     # 4. Cross bracing spacing (1 m < spacing < span)
     # -------------------------------------------------
     if cross_bracing_spacing <= 1000:
-        raise ValueError(
-            "Cross bracing spacing must be greater than 1 m."
-        )
+        return ERR_BRACING_SPACING_MIN
 
     if cross_bracing_spacing >= span_length:
-        raise ValueError(
-            "Cross bracing spacing must be less than span length."
-        )
+        return ERR_BRACING_SPACING_SPAN
 
     # -------------------------------------------------
     # 5. Carriageway width check (from figure)
@@ -59,21 +82,53 @@ def validate_bridge_inputs(
     carriageway_width = (num_girders - 1) * girder_spacing
 
     if carriageway_width <= 4250 or carriageway_width >= 24000:
-        raise ValueError(
-            f"Carriageway width {carriageway_width} mm is invalid. "
-            "Allowed range: 4250 mm < width < 24000 mm."
-        )
+        return ERR_CARRIAGEWAY_WIDTH
 
     # -------------------------------------------------
     # 6. Deck thickness check (from figure)
     # 100 mm < thickness < 500 mm
     # -------------------------------------------------
-    if deck_thickness is not None:
+    if has_deck_thickness:
         if deck_thickness <= 100 or deck_thickness >= 500:
-            raise ValueError(
-                f"Deck thickness {deck_thickness} mm is invalid. "
-                "Allowed range: 100 mm < thickness < 500 mm."
+            return ERR_DECK_THICKNESS
+
+    return 0
+
+
+def validate_bridge_inputs(
+    num_girders,
+    girder_spacing,
+    span_length,
+    cross_bracing_spacing,
+    deck_thickness=None,
+    footpath_config=None,
+    footpath_width=None
+):
+    """
+    Validates bridge input parameters based on design constraints
+    and cross-section guidelines (as per given figure).
+    All dimensions are in millimetres.
+
+    The checks run in the compiled _check_bridge_inputs();
+    this wrapper only looks its error code up in _ERROR_MESSAGES.
+    """
+    error = _check_bridge_inputs(
+        num_girders,
+        girder_spacing,
+        span_length,
+        cross_bracing_spacing,
+        deck_thickness is not None,
+        0.0 if deck_thickness is None else deck_thickness
+    )
+
+    if error:
+        carriageway_width = (num_girders - 1) * girder_spacing
+        raise ValueError(
+            _ERROR_MESSAGES[error].format(
+                carriageway_width=carriageway_width,
+                deck_thickness=deck_thickness
             )
+        )
 
     # -------------------------------------------------
     # 7. Footpath width check (from figure)
@@ -0,0 +1,106 @@
+# vtk_viewer.py
+# Alternative viewer: renders the (pre-meshed) bridge shapes with VTK
+# instead of OCC's AIS viewer. One vtkPolyData / actor per color.
+
+from OCC.Core.BRep import BRep_Tool
+from OCC.Core.TopAbs import TopAbs_FACE, TopAbs_REVERSED
+from OCC.Core.TopExp import TopExp_Explorer
+from OCC.Core.TopLoc import TopLoc_Location
+from OCC.Core.TopoDS import topods
+
+import vtk
+
+
+def _add_shape_triangles(shape, points, triangles):
+    """
+    Appends the triangulation of every face of shape to points/triangles.
+    Shapes must already be meshed (BRepMesh_IncrementalMesh).
+    """
+    explorer = TopExp_Explorer(shape, TopAbs_FACE)
+
+    while explorer.More():
+        face = topods.Face(explorer.Current())
+        explorer.Next()
+
+        location = TopLoc_Location()
+        triangulation = BRep_Tool.Triangulation(face, location)
+        if triangulation is None:
+            continue
+
+        trsf = location.Transformation()
+        offset = points.GetNumberOfPoints()
+
+        for i in range(1, triangulation.NbNodes() + 1):
+            p = triangulation.Node(i).Transformed(trsf)
+            points.InsertNextPoint(p.X(), p.Y(), p.Z())
+
+        reversed_face = face.Orientation() == TopAbs_REVERSED
+
+        for i in range(1, triangulation.NbTriangles() + 1):
+            n1, n2, n3 = triangulation.Triangle(i).Get()
+            if reversed_face:
+                n2, n3 = n3, n2
+
+            triangles.InsertNextCell(3)
+            triangles.InsertCellPoint(offset + n1 - 1)
+            triangles.InsertCellPoint(offset + n2 - 1)
+            triangles.InsertCellPoint(offset + n3 - 1)
+
+
+def _make_actor(shapes, rgb):
+    """Builds one VTK actor holding all triangles of shapes"""
+    points = vtk.vtkPoints()
+    triangles = vtk.vtkCellArray()
+
+    for shape in shapes:
+        _add_shape_triangles(shape, points, triangles)
+
+    poly_data = vtk.vtkPolyData()
+    poly_data.SetPoints(points)
+    poly_data.SetPolys(triangles)
+
+    mapper = vtk.vtkPolyDataMapper()
+    mapper.SetInputData(poly_data)
+
+    actor = vtk.vtkActor()
+    actor.SetMapper(mapper)
+    actor.GetProperty().SetColor(*rgb)
+    return actor
+
+
+def render_vtk(color_groups, window_title="Bridge 3D CAD"):
+    """
+    Renders shapes in a VTK window.
+
+    Parameters:
+    -----------
+    color_groups : list of (shapes, rgb)
+        Shapes sharing a color become a single actor (one draw call).
+    """
+    renderer = vtk.vtkRenderer()
+    renderer.SetBackground(1.0, 1.0, 1.0)
+
+    for shapes, rgb in color_groups:
+        if shapes:
+            renderer.AddActor(_make_actor(shapes, rgb))
+
+    window = vtk.vtkRenderWindow()
+    window.SetWindowName(window_title)
+    window.SetSize(1024, 768)
+    window.AddRenderer(renderer)
+
+    interactor = vtk.vtkRenderWindowInteractor()
+    interactor.SetRenderWindow(window)
+    interactor.SetInteractorStyle(
+        vtk.vtkInteractorStyleTrackballCamera()
+    )
+
+    # Same initial view direction as the OCC viewer (looking along X)
+    camera = renderer.GetActiveCamera()
+    camera.SetPosition(1, 0, 0)
+    camera.SetFocalPoint(0, 0, 0)
+    camera.SetViewUp(0, 0, 1)
+    renderer.ResetCamera()
+
+    window.Render()
+    interactor.Start()